@@ -9,6 +9,7 @@ import logging
 from metazcode.sdk.graph.graph_constructor import GraphClientBuilder
 from metazcode.cli.orchestrator import Orchestrator
 from metazcode.sdk.models.canonical_types import NodeType
+from metazcode.sdk.models.traceability import TraceabilityValidator
 from metazcode.sdk.integration.index_integration import IndexIntegration
 from metazcode.sdk.models.config import DatabaseConfig, MetaZenseConfig
 from metazcode.sdk.enrichment import EnrichmentPipeline
@@ -298,20 +299,21 @@ def dump(
 
         click.echo(f"[SUCCESS] Graph data saved to {output_path.resolve()}")
     else:
-        # Print to console (existing behavior)
-        click.echo("--- NODES ---")
+        # Print to console (existing behavior), buffered into a single write
+        lines = ["--- NODES ---"]
         for node_id, data in graph.nodes(data=True):
-            click.echo(f"ID: {node_id}")
-            for key, value in data.items():
-                click.echo(f"  {key}: {value}")
-            click.echo("----------")
+            lines.append(f"ID: {node_id}")
+            lines.extend(f"  {key}: {value}" for key, value in data.items())
+            lines.append("----------")
 
-        click.echo("\n--- EDGES ---")
+        lines.append("\n--- EDGES ---")
         for source, target, data in graph.edges(data=True):
-            click.echo(f"FROM: {source}")
-            click.echo(f"  TO: {target}")
-            click.echo(f"  RELATION: {data.get('relation', 'N/A')}")
-            click.echo("----------")
+            lines.append(f"FROM: {source}")
+            lines.append(f"  TO: {target}")
+            lines.append(f"  RELATION: {data.get('relation', 'N/A')}")
+            lines.append("----------")
+
+        click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -427,12 +429,13 @@ def analyze(
         # Show execution chains
         execution_order = analysis_results["detailed_analysis"]["execution_order"]
         if len(execution_order) > 1:
-            click.echo(f"\n[INFO] Execution order (sequential levels):")
+            lines = [f"\n[INFO] Execution order (sequential levels):"]
             for level, packages in enumerate(execution_order, 1):
                 package_names = [
                     pkg.split(":")[1] if ":" in pkg else pkg for pkg in packages
                 ]
-                click.echo(f"   Level {level}: {', '.join(package_names)}")
+                lines.append(f"   Level {level}: {', '.join(package_names)}")
+            click.echo("\n".join(lines))
         else:
             click.echo(
                 f"\n[INFO] All packages can execute in parallel (no dependencies)"
@@ -441,9 +444,12 @@ def analyze(
         # Show high-risk resources
         contention_risks = analysis_results["contention_risks"]
         if contention_risks["high_risk_connections"]:
-            click.echo(f"\n[WARNING] High-risk connections (resource contention):")
-            for risk in contention_risks["high_risk_connections"]:
-                click.echo(f"   {risk['connection']}: {risk['package_count']} packages")
+            lines = [f"\n[WARNING] High-risk connections (resource contention):"]
+            lines.extend(
+                f"   {risk['connection']}: {risk['package_count']} packages"
+                for risk in contention_risks["high_risk_connections"]
+            )
+            click.echo("\n".join(lines))
 
         # 6. Save analysis results if output specified
         if output:
@@ -738,23 +744,25 @@ def full(
         # Show execution order
         execution_order = analysis_results["detailed_analysis"]["execution_order"]
         if len(execution_order) > 1:
-            click.echo(f"")
-            click.echo(f"Execution Order:")
+            lines = ["", "Execution Order:"]
             for level, packages in enumerate(execution_order, 1):
                 package_names = [
                     pkg.split(":")[1] if ":" in pkg else pkg for pkg in packages
                 ]
-                click.echo(f"   Level {level}: {', '.join(package_names)}")
+                lines.append(f"   Level {level}: {', '.join(package_names)}")
+            click.echo("\n".join(lines))
         else:
             click.echo(f"All packages can execute in parallel")
 
         # Show warnings
         contention_risks = analysis_results["contention_risks"]
         if contention_risks["high_risk_connections"]:
-            click.echo(f"")
-            click.echo(f"High-Risk Resources:")
-            for risk in contention_risks["high_risk_connections"]:
-                click.echo(f"   {risk['connection']}: {risk['package_count']} packages")
+            lines = ["", "High-Risk Resources:"]
+            lines.extend(
+                f"   {risk['connection']}: {risk['package_count']} packages"
+                for risk in contention_risks["high_risk_connections"]
+            )
+            click.echo("\n".join(lines))
 
         # Phase 3: LLM Enrichment (Optional)
         if enable_llm or os.getenv("METAZCODE_ENABLE_LLM_ENRICHMENT", "false").lower() == "true":
@@ -1220,5 +1228,60 @@ def complete(
     )
 
 
+@cli.command("validate-traceability")
+@click.option(
+    "--graph-file",
+    default="enhanced_graph_full_analysis.json",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Exported graph JSON file to validate.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Revalidate even if this file's contents were validated before.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Validate graphs of 10,000+ elements across this many processes. The file "
+        "is then loaded whole; by default it is streamed in one process when "
+        "ijson is installed."
+    ),
+)
+@click.option(
+    "--verbose", "-v", is_flag=True, help="List every element missing traceability."
+)
+def validate_traceability(
+    graph_file: str, no_cache: bool, workers: Optional[int], verbose: bool
+):
+    """
+    Checks that every node and edge of an exported graph can be traced to its source file.
+
+    Example: metazcode validate-traceability --graph-file enhanced_graph_full_analysis.json
+    """
+    result = TraceabilityValidator.validate_graph_file(
+        graph_file, use_cache=not no_cache, max_workers=workers
+    )
+
+    # Build the whole report first and write it once
+    lines = [
+        f"Traceability report for {Path(graph_file).resolve()}",
+        f"   Nodes: {result['traceable_nodes']}/{result['total_nodes']} fully traceable",
+        f"   Edges: {result['traceable_edges']}/{result['total_edges']} fully traceable",
+    ]
+    if verbose:
+        lines.extend(
+            f"   [MISSING] node {node_id}" for node_id in result["untraceable_nodes"]
+        )
+        lines.extend(
+            f"   [MISSING] edge {edge}" for edge in result["untraceable_edges"]
+        )
+    elif result["untraceable_nodes"] or result["untraceable_edges"]:
+        lines.append("   Use --verbose to list the elements missing traceability.")
+    click.echo("\n".join(lines))
+
+
 if __name__ == "__main__":
     cli()
@@ -1,4 +1,5 @@
 from typing import List, Optional
+import importlib
 import pkgutil
 import inspect
 
@@ -28,12 +29,20 @@ class Orchestrator:
         """
         import metazcode.sdk.ingestion as ingestion_module
 
+        # Packages re-export their loaders, so the same class is reached from
+        # more than one module; instantiate each one only once
+        discovered = set()
         for _, name, _ in pkgutil.walk_packages(
             ingestion_module.__path__, ingestion_module.__name__ + "."
         ):
-            module = __import__(name, fromlist=[""])
+            module = importlib.import_module(name)
             for _, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, IngestionTool) and obj is not IngestionTool:
+                if (
+                    issubclass(obj, IngestionTool)
+                    and obj is not IngestionTool
+                    and obj not in discovered
+                ):
+                    discovered.add(obj)
                     # Check if the loader accepts the 'target_file' argument
                     sig = inspect.signature(obj.__init__)
                     if "target_file" in sig.parameters:
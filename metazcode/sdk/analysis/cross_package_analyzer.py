@@ -16,6 +16,12 @@ from ..graph.graph_client_interface import GraphClientInterface
 
 logger = logging.getLogger(__name__)
 
+# Node types that count as shared resources when an operation links to them
+_RESOURCE_NODE_TYPES = ('table', 'connection', 'parameter')
+
+# operation id -> resource node type -> [(resource id, edge data)]
+_OperationResources = Dict[str, Dict[str, List[Tuple[str, Dict[str, Any]]]]]
+
 
 class CrossPackageAnalyzer:
     """
@@ -46,9 +52,16 @@ class CrossPackageAnalyzer:
         logger.info(f"Found {len(packages)} packages to analyze")
         
         # Analyze shared resources
-        shared_tables = self._analyze_shared_tables(packages)
-        shared_connections = self._analyze_shared_connections(packages)
-        shared_parameters = self._analyze_shared_parameters(packages)
+        package_operations, operation_resources = self._bucket_package_resources(packages)
+        shared_tables = self._analyze_shared_tables(
+            packages, package_operations, operation_resources
+        )
+        shared_connections = self._analyze_shared_connections(
+            packages, package_operations, operation_resources
+        )
+        shared_parameters = self._analyze_shared_parameters(
+            packages, package_operations, operation_resources
+        )
         
         # Analyze data flow dependencies
         data_dependencies = self._analyze_data_flow_dependencies(packages, shared_tables)
@@ -157,33 +170,49 @@ class CrossPackageAnalyzer:
         
         return graph
     
-    def _analyze_shared_tables(self, packages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    def _bucket_package_resources(
+        self, packages: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, List[str]], _OperationResources]:
+        """
+        Walk the edges once, collecting the operations contained by each package and
+        the resource nodes each operation links to, bucketed by resource node type.
+        """
+        package_ids = {package['id'] for package in packages}
+        package_operations: Dict[str, List[str]] = {}
+        operation_resources: _OperationResources = {}
+        
+        graph_nodes = self.graph.nodes
+        for source, target, edge_data in self.graph.edges(data=True):
+            target_type = graph_nodes[target].get('node_type')
+            if target_type == 'operation':
+                if source in package_ids and edge_data.get('relation') == 'contains':
+                    package_operations.setdefault(source, []).append(target)
+            elif target_type in _RESOURCE_NODE_TYPES:
+                operation_resources.setdefault(source, {}).setdefault(target_type, []).append(
+                    (target, edge_data)
+                )
+        
+        return package_operations, operation_resources
+    
+    def _analyze_shared_tables(self, packages: List[Dict[str, Any]],
+                               package_operations: Dict[str, List[str]],
+                               operation_resources: _OperationResources) -> Dict[str, Dict[str, Any]]:
         """Identify tables that are used by multiple packages."""
         table_usage = defaultdict(lambda: {'readers': set(), 'writers': set(), 'packages': set()})
         
         for package in packages:
             package_id = package['id']
             
-            # Find all operations in this package
-            package_operations = []
-            for source, target, edge_data in self.graph.edges(data=True):
-                if (source == package_id and 
-                    edge_data.get('relation') == 'contains' and 
-                    self.graph.nodes[target].get('node_type') == 'operation'):
-                    package_operations.append(target)
-            
-            # Analyze table usage for each operation
-            for operation_id in package_operations:
-                for source, target, edge_data in self.graph.edges(data=True):
-                    if (source == operation_id and 
-                        self.graph.nodes[target].get('node_type') == 'table'):
-                        relation = edge_data.get('relation')
-                        if relation == 'writes_to':
-                            table_usage[target]['writers'].add(operation_id)
-                            table_usage[target]['packages'].add(package_id)
-                        elif relation == 'reads_from':
-                            table_usage[target]['readers'].add(operation_id)
-                            table_usage[target]['packages'].add(package_id)
+            # Analyze table usage for each operation in this package
+            for operation_id in package_operations.get(package_id, ()):
+                for target, edge_data in operation_resources.get(operation_id, {}).get('table', ()):
+                    relation = edge_data.get('relation')
+                    if relation == 'writes_to':
+                        table_usage[target]['writers'].add(operation_id)
+                        table_usage[target]['packages'].add(package_id)
+                    elif relation == 'reads_from':
+                        table_usage[target]['readers'].add(operation_id)
+                        table_usage[target]['packages'].add(package_id)
         
         # Filter to only shared tables (used by multiple packages)
         shared_tables = {}
@@ -202,27 +231,19 @@ class CrossPackageAnalyzer:
         
         return shared_tables
     
-    def _analyze_shared_connections(self, packages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    def _analyze_shared_connections(self, packages: List[Dict[str, Any]],
+                                    package_operations: Dict[str, List[str]],
+                                    operation_resources: _OperationResources) -> Dict[str, Dict[str, Any]]:
         """Identify connections that are used by multiple packages."""
         connection_usage = defaultdict(set)
         
         for package in packages:
             package_id = package['id']
             
-            # Find all operations in this package that use connections  
-            package_operations = []
-            for source, target, edge_data in self.graph.edges(data=True):
-                if (source == package_id and 
-                    edge_data.get('relation') == 'contains' and 
-                    self.graph.nodes[target].get('node_type') == 'operation'):
-                    package_operations.append(target)
-            
-            # Check if operations use any connections
-            for operation_id in package_operations:
-                for source, target, edge_data in self.graph.edges(data=True):
-                    if (source == operation_id and 
-                        self.graph.nodes[target].get('node_type') == 'connection' and 
-                        edge_data.get('relation') == 'uses_connection'):
+            # Check if operations in this package use any connections
+            for operation_id in package_operations.get(package_id, ()):
+                for target, edge_data in operation_resources.get(operation_id, {}).get('connection', ()):
+                    if edge_data.get('relation') == 'uses_connection':
                         connection_usage[target].add(package_id)
         
         # Filter to only shared connections
@@ -240,27 +261,19 @@ class CrossPackageAnalyzer:
         
         return shared_connections
     
-    def _analyze_shared_parameters(self, packages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    def _analyze_shared_parameters(self, packages: List[Dict[str, Any]],
+                                   package_operations: Dict[str, List[str]],
+                                   operation_resources: _OperationResources) -> Dict[str, Dict[str, Any]]:
         """Identify parameters that are used by multiple packages."""
         parameter_usage = defaultdict(set)
         
         for package in packages:
             package_id = package['id']
             
-            # Find all operations in this package that use parameters
-            package_operations = []
-            for source, target, edge_data in self.graph.edges(data=True):
-                if (source == package_id and 
-                    edge_data.get('relation') == 'contains' and 
-                    self.graph.nodes[target].get('node_type') == 'operation'):
-                    package_operations.append(target)
-            
-            # Check if operations use any parameters
-            for operation_id in package_operations:
-                for source, target, edge_data in self.graph.edges(data=True):
-                    if (source == operation_id and 
-                        self.graph.nodes[target].get('node_type') == 'parameter' and 
-                        edge_data.get('relation') == 'uses_parameter'):
+            # Check if operations in this package use any parameters
+            for operation_id in package_operations.get(package_id, ()):
+                for target, edge_data in operation_resources.get(operation_id, {}).get('parameter', ()):
+                    if edge_data.get('relation') == 'uses_parameter':
                         parameter_usage[target].add(package_id)
         
         # Filter to only shared parameters
@@ -282,6 +295,13 @@ class CrossPackageAnalyzer:
         """Analyze data flow dependencies between packages via shared tables."""
         dependencies = []
         
+        # Container of each node: the source of the first 'contains' edge pointing
+        # at it, indexed in one pass instead of rescanning all edges per operation
+        containers: Dict[str, str] = {}
+        for source, target, edge_data in self.graph.edges(data=True):
+            if edge_data.get('relation') == 'contains':
+                containers.setdefault(target, source)
+        
         for table_id, table_info in shared_tables.items():
             if table_info['is_integration_point']:
                 # This table has both writers and readers across packages
@@ -290,18 +310,12 @@ class CrossPackageAnalyzer:
                 
                 # Determine which packages write vs read this table
                 for writer_op in table_info['writers']:
-                    for source, target, edge_data in self.graph.edges(data=True):
-                        if (target == writer_op and 
-                            edge_data.get('relation') == 'contains'):
-                            writer_packages.add(source)
-                            break
+                    if writer_op in containers:
+                        writer_packages.add(containers[writer_op])
                 
                 for reader_op in table_info['readers']:
-                    for source, target, edge_data in self.graph.edges(data=True):
-                        if (target == reader_op and 
-                            edge_data.get('relation') == 'contains'):
-                            reader_packages.add(source)
-                            break
+                    if reader_op in containers:
+                        reader_packages.add(containers[reader_op])
                 
                 # Create dependencies: writers must complete before readers
                 for writer_pkg in writer_packages:
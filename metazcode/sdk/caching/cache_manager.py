@@ -11,6 +11,11 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from metazcode.sdk.models.graph import Node
 
 
@@ -44,12 +49,20 @@ class SummaryCache:
         self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
         self._metadata: Dict[str, Any] = self._load_metadata()
 
+    def _read_json(self, path: Path) -> Any:
+        """Read a JSON file, decoding with orjson when it is installed."""
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
     def _load_cache(self) -> Dict[str, Dict[str, Any]]:
         """Load cache from disk."""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return self._read_json(self.cache_file)
             except (json.JSONDecodeError, FileNotFoundError):
                 return {}
         return {}
@@ -58,8 +71,7 @@ class SummaryCache:
         """Load cache metadata from disk."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return self._read_json(self.metadata_file)
             except (json.JSONDecodeError, FileNotFoundError):
                 return self._create_default_metadata()
         return self._create_default_metadata()
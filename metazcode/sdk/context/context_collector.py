@@ -9,6 +9,7 @@ This module implements Task 1.1: Build Context Collection Functions
 This is part of the optional LLM enrichment layer and requires a graph client.
 """
 
+from collections import Counter
 from typing import Dict, Any, Optional, List
 from metazcode.sdk.graph.graph_client_interface import GraphClientInterface
 from metazcode.sdk.models.canonical_types import EdgeType, NodeType
@@ -136,22 +137,20 @@ class ContextCollector:
         if "TableOrViewName" in properties:
             details["table_or_file"] = properties["TableOrViewName"]
 
-        # File connections
         if "ConnectionString" in properties:
             conn_str = properties["ConnectionString"]
-            # Extract file path from connection string if it's a file
+
+            # File connections: extract file path from connection string if it's a file
             if "file://" in conn_str.lower() or "\\" in conn_str or "/" in conn_str:
                 details["table_or_file"] = conn_str
 
-        # OLE DB connections
-        if "ConnectionString" in properties:
-            conn_str = properties["ConnectionString"]
-            # Parse common connection string patterns
+            # OLE DB connections: parse common connection string patterns
             if "Data Source=" in conn_str:
                 for part in conn_str.split(";"):
-                    if part.strip().startswith("Data Source="):
+                    part = part.strip()
+                    if part.startswith("Data Source="):
                         details["server"] = part.split("=", 1)[1].strip()
-                    elif part.strip().startswith("Initial Catalog="):
+                    elif part.startswith("Initial Catalog="):
                         details["database"] = part.split("=", 1)[1].strip()
 
         return details
@@ -169,19 +168,12 @@ class ContextCollector:
         if not transformations:
             return "No transformations"
 
-        # Count transformations by type
-        transformation_counts = {}
-
-        for transform in transformations:
-            transform_type = transform.get("type", "unknown")
-
-            # Normalize transformation type names for readability
-            readable_type = self._normalize_transformation_type(transform_type)
-
-            if readable_type in transformation_counts:
-                transformation_counts[readable_type] += 1
-            else:
-                transformation_counts[readable_type] = 1
+        # Count transformations by type, with type names normalized for readability;
+        # Counter keeps first-seen order for the summary
+        transformation_counts = Counter(
+            self._normalize_transformation_type(transform.get("type", "unknown"))
+            for transform in transformations
+        )
 
         # Build summary string
         if not transformation_counts:
@@ -242,12 +234,10 @@ class ContextCollector:
         context = self.get_operation_context(operation_node_id)
 
         # Add transformation summaries if available
-        if "transformations" in context["operation_details"].get("properties", {}):
-            transformations = context["operation_details"]["properties"][
-                "transformations"
-            ]
+        operation_properties = context["operation_details"].get("properties", {})
+        if "transformations" in operation_properties:
             context["transformation_summary"] = self.summarize_transformations(
-                transformations
+                operation_properties["transformations"]
             )
         else:
             context["transformation_summary"] = "No transformations"
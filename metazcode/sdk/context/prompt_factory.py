@@ -652,12 +652,15 @@ Generate a concise llm_summary that explains what this relationship accomplishes
         if semantic_props:
             return '; '.join(semantic_props)
         
-        # Fallback to generic properties
+        # Fallback to generic properties; only the first three are shown, so stop
+        # before formatting the rest (values can be large dicts or lists)
         generic_props = []
         for key, value in properties.items():
             if key not in ['llm_summary', 'llm_enriched_at', 'llm_model', 'source_context']:
                 if isinstance(value, str) and len(value) > 50:
                     value = value[:50] + "..."
                 generic_props.append(f"{key}: {value}")
+                if len(generic_props) == 3:
+                    break
         
-        return '; '.join(generic_props[:3]) if generic_props else "No semantic properties"
+        return '; '.join(generic_props) if generic_props else "No semantic properties"
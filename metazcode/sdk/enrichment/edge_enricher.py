@@ -7,6 +7,8 @@ business logic such as joins, filters, transformations, and data flows.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -32,7 +34,8 @@ class EdgeEnricher:
         self, 
         graph_client: GraphClientInterface, 
         llm_client: OpenAIEnricher,
-        skip_enriched: bool = True
+        skip_enriched: bool = True,
+        max_workers: int = 10
     ):
         """
         Initialize the edge enricher.
@@ -41,11 +44,20 @@ class EdgeEnricher:
             graph_client: Interface to the graph database
             llm_client: LLM client for generating summaries
             skip_enriched: Whether to skip already enriched edges
+            max_workers: Number of edges to enrich concurrently
         """
         self.graph_client = graph_client
         self.llm_client = llm_client
         self.prompt_factory = PromptFactory()
         self.skip_enriched = skip_enriched
+        self.max_workers = max_workers
+        
+        # Counters are updated from worker threads in enrich_semantic_edges
+        self._stats_lock = threading.Lock()
+        
+        # Graph clients may share a single connection, so worker threads take
+        # turns using it; LLM requests run outside the lock
+        self._client_lock = threading.Lock()
         
         # Track enrichment statistics
         self.stats = {
@@ -73,8 +85,36 @@ class EdgeEnricher:
             
             logger.info(f"Found {len(semantic_edges)} semantic edges to enrich out of {len(all_edges)} total edges")
             
-            for edge_id, source, target in semantic_edges:
-                self.enrich_edge_by_id(edge_id, source, target)
+            # Look every edge up once instead of rescanning all edges per edge;
+            # the first edge between two nodes wins, as in enrich_edge_by_id
+            edges_by_endpoints: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            for edge in all_edges:
+                edge_dict = edge.to_dict()
+                edges_by_endpoints.setdefault(
+                    (edge_dict.get("source_id"), edge_dict.get("target_id")), edge_dict
+                )
+            
+            # Each edge is an independent LLM request, so run them concurrently
+            # the same way BatchProcessor handles nodes
+            if semantic_edges:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(semantic_edges))) as executor:
+                    future_to_edge = {
+                        executor.submit(
+                            self._enrich_edge_dict,
+                            source,
+                            target,
+                            edges_by_endpoints.get((source, target)),
+                        ): (source, target)
+                        for _, source, target in semantic_edges
+                    }
+                    
+                    for future in as_completed(future_to_edge):
+                        source, target = future_to_edge[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logger.error(f"Exception enriching edge {source} -> {target}: {e}")
+                            self._increment_stat("failed")
                 
             logger.info(f"Edge enrichment complete: {self.stats}")
             return self.stats
@@ -83,6 +123,11 @@ class EdgeEnricher:
             logger.error(f"Error during edge enrichment: {e}")
             return self.stats
     
+    def _increment_stat(self, key: str) -> None:
+        """Increment an enrichment counter; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
     def enrich_edge(self, source_id: str, target_id: str, edge_key: int = 0) -> bool:
         """
         Enrich a single edge with an LLM-generated summary.
@@ -110,7 +155,7 @@ class EdgeEnricher:
             # Check if already enriched
             if self.skip_enriched and edge_data.get("llm_summary"):
                 logger.debug(f"Edge {source_id} -> {target_id} already enriched, skipping")
-                self.stats["skipped"] += 1
+                self._increment_stat("skipped")
                 return True
             
             # Generate summary based on edge type
@@ -118,15 +163,15 @@ class EdgeEnricher:
             
             if summary:
                 self._update_edge_with_summary(source_id, target_id, edge_key, summary)
-                self.stats["successfully_enriched"] += 1
+                self._increment_stat("successfully_enriched")
                 return True
             else:
-                self.stats["failed"] += 1
+                self._increment_stat("failed")
                 return False
                 
         except Exception as e:
             logger.error(f"Error enriching edge {source_id} -> {target_id}: {e}")
-            self.stats["failed"] += 1
+            self._increment_stat("failed")
             return False
     
     def enrich_edge_by_id(self, edge_id: str, source_id: str, target_id: str) -> bool:
@@ -143,7 +188,8 @@ class EdgeEnricher:
         """
         try:
             # Get all edges and find the one we want
-            all_edges = self.graph_client.get_all_edges()
+            with self._client_lock:
+                all_edges = self.graph_client.get_all_edges()
             target_edge = None
             
             for edge in all_edges:
@@ -153,6 +199,28 @@ class EdgeEnricher:
                     target_edge = edge_dict
                     break
             
+            return self._enrich_edge_dict(source_id, target_id, target_edge)
+                
+        except Exception as e:
+            logger.error(f"Error enriching edge {source_id} -> {target_id}: {e}")
+            self._increment_stat("failed")
+            return False
+    
+    def _enrich_edge_dict(
+        self, source_id: str, target_id: str, target_edge: Optional[Dict[str, Any]]
+    ) -> bool:
+        """
+        Enrich an edge that has already been looked up from the graph client.
+        
+        Args:
+            source_id: Source node ID
+            target_id: Target node ID
+            target_edge: Edge dictionary, or None if the edge was not found
+            
+        Returns:
+            True if successfully enriched, False otherwise
+        """
+        try:
             if not target_edge:
                 logger.warning(f"Edge {source_id} -> {target_id} not found")
                 return False
@@ -161,7 +229,7 @@ class EdgeEnricher:
             properties = target_edge.get("properties", {})
             if self.skip_enriched and properties.get("llm_summary"):
                 logger.debug(f"Edge {source_id} -> {target_id} already enriched, skipping")
-                self.stats["skipped"] += 1
+                self._increment_stat("skipped")
                 return True
             
             # Generate summary based on edge type
@@ -169,15 +237,15 @@ class EdgeEnricher:
             
             if summary:
                 self._update_edge_with_summary_dict(target_edge, summary)
-                self.stats["successfully_enriched"] += 1
+                self._increment_stat("successfully_enriched")
                 return True
             else:
-                self.stats["failed"] += 1
+                self._increment_stat("failed")
                 return False
                 
         except Exception as e:
             logger.error(f"Error enriching edge {source_id} -> {target_id}: {e}")
-            self.stats["failed"] += 1
+            self._increment_stat("failed")
             return False
     
     def _identify_semantic_edges(self, graph) -> List[Tuple[str, str, int]]:
@@ -453,8 +521,9 @@ class EdgeEnricher:
             }
             
             # Get source and target node information
-            source_node = self.graph_client.get_node(source_id)
-            target_node = self.graph_client.get_node(target_id)
+            with self._client_lock:
+                source_node = self.graph_client.get_node(source_id)
+                target_node = self.graph_client.get_node(target_id)
             
             if source_node:
                 context["source_details"] = source_node.get("attributes", {})
@@ -497,17 +566,18 @@ class EdgeEnricher:
             if source_id and target_id:
                 # Try to update using existing NetworkX method as fallback
                 try:
-                    graph = self.graph_client.get_graph()
-                    if hasattr(graph, 'edges') and hasattr(graph, 'get_edge_data'):
-                        edge_data = graph.get_edge_data(source_id, target_id)
-                        if edge_data:
-                            for key, value in enrichment_properties.items():
-                                edge_data[key] = value
-                            logger.debug(f"Updated edge {source_id} -> {target_id} with LLM summary")
+                    with self._client_lock:
+                        graph = self.graph_client.get_graph()
+                        if hasattr(graph, 'edges') and hasattr(graph, 'get_edge_data'):
+                            edge_data = graph.get_edge_data(source_id, target_id)
+                            if edge_data:
+                                for key, value in enrichment_properties.items():
+                                    edge_data[key] = value
+                                logger.debug(f"Updated edge {source_id} -> {target_id} with LLM summary")
+                            else:
+                                logger.warning(f"Edge data not found for {source_id} -> {target_id}")
                         else:
-                            logger.warning(f"Edge data not found for {source_id} -> {target_id}")
-                    else:
-                        logger.debug(f"Backend doesn't support direct edge updates for {source_id} -> {target_id}")
+                            logger.debug(f"Backend doesn't support direct edge updates for {source_id} -> {target_id}")
                 except Exception as e:
                     logger.warning(f"Could not update edge {source_id} -> {target_id}: {e}")
             else:
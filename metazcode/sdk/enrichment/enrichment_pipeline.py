@@ -51,7 +51,7 @@ class EnrichmentPipeline:
             provider: LLM provider to use (openai, openrouter)
             model: LLM model to use for enrichment (uses provider default if not specified)
             api_key: API key for the LLM provider (defaults to env var)
-            batch_size: Number of nodes to process in parallel
+            batch_size: Number of nodes (and semantic edges) to process in parallel
             **provider_kwargs: Additional provider-specific arguments
         """
         self.graph_client = graph_client
@@ -69,7 +69,7 @@ class EnrichmentPipeline:
         
         # Initialize components
         self.node_enricher = NodeEnricher(graph_client, self.llm_client)
-        self.edge_enricher = EdgeEnricher(graph_client, self.llm_client)
+        self.edge_enricher = EdgeEnricher(graph_client, self.llm_client, max_workers=batch_size)
         self.batch_processor = BatchProcessor(self.node_enricher, batch_size)
         
         # Track pipeline statistics
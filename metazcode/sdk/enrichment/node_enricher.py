@@ -15,6 +15,7 @@ The enricher uses universal node concepts and context-aware prompt generation.
 
 import logging
 from datetime import datetime
+from itertools import islice
 from typing import Optional, Dict, Any, List
 
 from metazcode.sdk.graph.graph_client_interface import GraphClientInterface
@@ -96,7 +97,7 @@ class NodeEnricher:
             elif node_type == "pipeline":  
                 summary = self._enrich_pipeline_node(node_data)
             else:
-                logger.debug(f"Node type '{node_type}' not supported for enrichment. Node attributes: {list(attributes.keys())[:10]}")
+                logger.debug(f"Node type '{node_type}' not supported for enrichment. Node attributes: {list(islice(attributes, 10))}")
                 return False
             
             # Update node if summary generated
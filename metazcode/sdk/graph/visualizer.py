@@ -1,6 +1,14 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 
+# Fill color for each node type; any other type is drawn gray
+_NODE_TYPE_COLORS = {
+    "pipeline": "skyblue",
+    "operation": "lightgreen",
+    "table": "salmon",
+    "connection": "gold",
+}
+
 
 def visualize_graph(graph: nx.DiGraph, output_path: str):
     """
@@ -12,19 +20,10 @@ def visualize_graph(graph: nx.DiGraph, output_path: str):
     pos = nx.spring_layout(graph, k=0.5, iterations=50)
 
     # Color nodes by their type
-    node_colors = []
-    for node in graph.nodes(data=True):
-        node_type = node[1].get("node_type", "unknown")
-        if node_type == "pipeline":
-            node_colors.append("skyblue")
-        elif node_type == "operation":
-            node_colors.append("lightgreen")
-        elif node_type == "table":
-            node_colors.append("salmon")
-        elif node_type == "connection":
-            node_colors.append("gold")
-        else:
-            node_colors.append("gray")
+    node_colors = [
+        _NODE_TYPE_COLORS.get(data.get("node_type", "unknown"), "gray")
+        for _, data in graph.nodes(data=True)
+    ]
 
     nx.draw_networkx_nodes(graph, pos, node_color=node_colors, node_size=2000)
 
@@ -157,10 +157,10 @@ class SSISEnhancedHierarchicalIndex(HierarchicalEntityIndex):
         
         # Cross-Package Dependencies (breakthrough feature)
         if deps := node.properties.get("upstream_dependencies"):
-            tokens.extend([f"depends_on_{dep.split(':')[-1]}" for dep in deps])
+            tokens.extend([f"depends_on_{dep.rpartition(':')[2]}" for dep in deps])
         
         if shared_tables := node.properties.get("shared_tables_used"):
-            tokens.extend([f"uses_table_{table.split(':')[-1]}" for table in shared_tables])
+            tokens.extend([f"uses_table_{table.rpartition(':')[2]}" for table in shared_tables])
         
         # Connection Expression Analysis (100% coverage)
         if expr_analysis := node.properties.get("expression_analysis"):
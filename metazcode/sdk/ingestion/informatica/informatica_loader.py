@@ -7,17 +7,53 @@ It discovers and orchestrates the parsing of Informatica assets including workfl
 mappings, and parameter files.
 """
 
-from ..ingestion_tool import IngestionTool
+from ..ingestion_tool import IngestionTool, _compile_glob
 from .informatica_parser import CanonicalInformaticaParser
-from typing import Generator, Tuple, List, Dict, Any
+from typing import Generator, Tuple, List, Dict, Any, Optional
 from ...models.graph import Node, Edge
 from ...models.canonical_types import NodeType
 import logging
+import multiprocessing
+import os
 import re
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# File name patterns used for discovery, in priority order
+_WORKFLOW_PATTERNS = (
+    "WorkFlow_*.XML",
+    "wf_*.xml",
+    "wf_*.XML",
+    "*workflow*.xml",
+    "*workflow*.XML",
+)
+_MAPPING_PATTERNS = ("Mapping_*.XML", "m_*.XML", "*mapping*.XML", "*mapping*.xml")
+_CONNECTION_PATTERNS = ("*.con", "*.cnx", "*.connection")
+
+# Parser owned by each worker process, built once by _init_worker
+_worker_parser: Optional[CanonicalInformaticaParser] = None
+
+
+def _init_worker(
+    connections_context: Dict[str, Dict[str, Any]],
+    parameters_context: Dict[str, Dict[str, Any]],
+) -> None:
+    """Pool initializer: build the worker's parser with the shared contexts."""
+    global _worker_parser
+    _worker_parser = CanonicalInformaticaParser(
+        connections_context=connections_context,
+        parameters_context=parameters_context,
+    )
+
+
+def _parse_workflow_pair(
+    workflow_and_mapping: Tuple[str, Optional[str]]
+) -> List[Tuple[List[Node], List[Edge]]]:
+    """Worker entry point: parse one workflow file and its mapping file end to end."""
+    workflow_file, mapping_file = workflow_and_mapping
+    return list(_worker_parser.parse(workflow_file, mapping_file))
+
 
 class InformaticaLoader(IngestionTool):
     """
@@ -28,6 +64,11 @@ class InformaticaLoader(IngestionTool):
     for Informatica's specific file and project conventions.
     """
 
+    # Worker processes used to parse workflow files; None means os.cpu_count()
+    # for projects of at least PARALLEL_PARSE_THRESHOLD bytes and in-process
+    # parsing below it. Set to 1 to always parse in-process.
+    max_workers: Optional[int] = None
+
     def ingest(self) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
         """
         Discovers and parses all Informatica workflow files in the project directory.
@@ -60,12 +101,6 @@ class InformaticaLoader(IngestionTool):
         if parameter_nodes:
             logger.info(f"Created {len(parameter_nodes)} Informatica parameter node(s).")
 
-        # Create parser with both connection and parameter contexts
-        parser = CanonicalInformaticaParser(
-            connections_context=connections_context,
-            parameters_context=parameters_context,
-        )
-        
         # Discover workflow files using common Informatica patterns
         workflow_files = self._discover_workflow_files()
         if workflow_files:
@@ -80,6 +115,20 @@ class InformaticaLoader(IngestionTool):
             yield all_global_nodes, []
 
         # Process each workflow file
+        workers = self.parse_worker_count(workflow_files, self.max_workers)
+        if workers > 1:
+            yield from self._parse_workflow_files_parallel(
+                workflow_files, workers, connections_context, parameters_context
+            )
+            return
+
+        # Create one parser with both connection and parameter contexts and reuse it
+        # for every workflow file (pool workers build their own in _init_worker)
+        parser = CanonicalInformaticaParser(
+            connections_context=connections_context,
+            parameters_context=parameters_context,
+        )
+
         for workflow_file in workflow_files:
             try:
                 logger.info(f"Processing Informatica workflow: {workflow_file}")
@@ -94,6 +143,40 @@ class InformaticaLoader(IngestionTool):
                 logger.error(f"Failed to parse {workflow_file}: {e}", exc_info=True)
                 continue
 
+    def _parse_workflow_files_parallel(
+        self,
+        workflow_files: List[Path],
+        workers: int,
+        connections_context: Dict[str, Dict[str, Any]],
+        parameters_context: Dict[str, Dict[str, Any]],
+    ) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
+        """
+        Parse workflow/mapping file pairs in a process pool.
+        
+        Each worker runs CanonicalInformaticaParser end to end and returns plain
+        (nodes, edges) batches, so no XML trees cross process boundaries. Results
+        are yielded in workflow file order.
+        """
+        pairs = []
+        for workflow_file in workflow_files:
+            try:
+                logger.info(f"Processing Informatica workflow: {workflow_file}")
+                
+                # Find corresponding mapping file
+                pairs.append((str(workflow_file), self._find_mapping_file(workflow_file)))
+                
+            except Exception as e:
+                logger.error(f"Failed to parse {workflow_file}: {e}", exc_info=True)
+                continue
+
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(connections_context, parameters_context),
+        ) as pool:
+            for batches in pool.imap(_parse_workflow_pair, pairs):
+                yield from batches
+
     def _parse_parameter_files(self) -> Dict[str, Dict[str, Any]]:
         """
         Discovers and parses .par files to extract Informatica parameters.
@@ -183,30 +266,15 @@ class InformaticaLoader(IngestionTool):
         Returns:
             List of discovered workflow file paths
         """
-        workflow_files = []
-        
-        # Primary patterns for Informatica workflow files
-        patterns = [
-            "WorkFlow_*.XML",
-            "wf_*.xml",
-            "wf_*.XML",
-            "*workflow*.xml",
-            "*workflow*.XML"
-        ]
-        
-        for pattern in patterns:
-            files = self.discover_files(pattern)
-            workflow_files.extend(files)
-        
-        # Remove duplicates while preserving order
-        unique_files = []
-        seen = set()
-        for file in workflow_files:
-            if file not in seen:
-                seen.add(file)
-                unique_files.append(file)
-        
-        return unique_files
+        # Primary patterns for Informatica workflow files; a file matching
+        # several patterns is kept once, at its first position
+        unique_files = dict.fromkeys(
+            file
+            for files in self.discover_all(_WORKFLOW_PATTERNS).values()
+            for file in files
+        )
+        
+        return list(unique_files)
 
     def _find_mapping_file(self, workflow_file: Path) -> str:
         """
@@ -250,20 +318,32 @@ class InformaticaLoader(IngestionTool):
             directory / f"{base_name.replace('workflow', 'mapping')}.XML"
         ])
         
+        # List the directory once; candidate checks and the pattern fallback
+        # below test names against it instead of stat'ing each path
+        try:
+            with os.scandir(directory) as entries:
+                file_names = [entry.name for entry in entries if entry.is_file()]
+        except OSError:
+            file_names = []
+        present_names = {os.path.normcase(name) for name in file_names}
+        
         # Check which mapping file exists
         for candidate in mapping_candidates:
-            if candidate.exists():
+            if os.path.normcase(candidate.name) in present_names:
                 logger.info(f"Found mapping file: {candidate}")
                 return str(candidate)
         
         # Look for any mapping files in the same directory
-        mapping_patterns = ["Mapping_*.XML", "m_*.XML", "*mapping*.XML", "*mapping*.xml"]
-        for pattern in mapping_patterns:
-            mapping_files = list(directory.glob(pattern))
-            if mapping_files:
+        for pattern in _MAPPING_PATTERNS:
+            match = _compile_glob(pattern).match
+            mapping_name = next(
+                (name for name in file_names if match(os.path.normcase(name))), None
+            )
+            if mapping_name is not None:
                 # Return the first mapping file found
-                logger.info(f"Using mapping file: {mapping_files[0]}")
-                return str(mapping_files[0])
+                mapping_file = directory / mapping_name
+                logger.info(f"Using mapping file: {mapping_file}")
+                return str(mapping_file)
         
         logger.warning(f"No mapping file found for workflow: {workflow_file}")
         return None
@@ -323,18 +403,18 @@ class InformaticaLoader(IngestionTool):
         connections_context = {}
         
         # Discover connection files using common patterns
-        connection_patterns = ["*.con", "*.cnx", "*.connection"]
         connection_files = []
         
-        for pattern in connection_patterns:
-            files = self.discover_files(pattern)
+        for files in self.discover_all(_CONNECTION_PATTERNS).values():
             connection_files.extend(files)
         
         for connection_file in connection_files:
             try:
                 logger.debug(f"Parsing Informatica connection file: {connection_file}")
                 
-                with open(connection_file, "r", encoding="utf-8") as f:
+                # Read raw bytes; XML content goes to lxml undecoded so that
+                # its own encoding declaration is honoured
+                with open(connection_file, "rb") as f:
                     content = f.read()
                 
                 # Parse connection file content
@@ -352,7 +432,7 @@ class InformaticaLoader(IngestionTool):
         
         return connections_context
 
-    def _parse_connection_content(self, content: str, file_path: str) -> Dict[str, Dict[str, Any]]:
+    def _parse_connection_content(self, content: bytes, file_path: str) -> Dict[str, Dict[str, Any]]:
         """
         Parse the content of an Informatica connection file.
         
@@ -362,7 +442,7 @@ class InformaticaLoader(IngestionTool):
         - Binary/proprietary format (skip these)
         
         Args:
-            content: Raw file content
+            content: Raw file bytes
             file_path: Path to the connection file
             
         Returns:
@@ -371,20 +451,20 @@ class InformaticaLoader(IngestionTool):
         connections = {}
         
         # Try to parse as XML first (most common format)
-        if content.strip().startswith('<?xml') or '<' in content:
+        if b'<' in content:
             connections.update(self._parse_xml_connection_content(content, file_path))
         else:
             # Try to parse as key-value format
-            connections.update(self._parse_keyvalue_connection_content(content, file_path))
+            connections.update(self._parse_keyvalue_connection_content(content.decode('utf-8'), file_path))
         
         return connections
 
-    def _parse_xml_connection_content(self, content: str, file_path: str) -> Dict[str, Dict[str, Any]]:
+    def _parse_xml_connection_content(self, content: bytes, file_path: str) -> Dict[str, Dict[str, Any]]:
         """
         Parse XML-formatted Informatica connection files.
         
         Args:
-            content: XML content
+            content: Raw XML bytes
             file_path: Path to the connection file
             
         Returns:
@@ -396,7 +476,7 @@ class InformaticaLoader(IngestionTool):
             from lxml import etree
             
             # Parse XML content
-            root = etree.fromstring(content.encode('utf-8'))
+            root = etree.fromstring(content)
             
             # Look for connection elements (common patterns)
             connection_elements = (
@@ -453,6 +533,8 @@ class InformaticaLoader(IngestionTool):
         connections = {}
         current_connection = {}
         connection_name = None
+        # Every key=value pair in file order, reused if no named connection is found
+        pairs = []
         
         for line in content.split('\n'):
             line = line.strip()
@@ -466,6 +548,7 @@ class InformaticaLoader(IngestionTool):
                 key, value = line.split('=', 1)
                 key = key.strip().upper()
                 value = value.strip().strip('"\'')
+                pairs.append((key, value))
                 
                 # Connection name detection
                 if key in ['CONNECTION_NAME', 'NAME', 'CONN_NAME']:
@@ -500,26 +583,20 @@ class InformaticaLoader(IngestionTool):
             connections[connection_name] = current_connection
         
         # If no named connections found, create a default one from all properties
-        if not connections and any('=' in line for line in content.split('\n')):
+        if not connections and pairs:
             default_conn = {"name": "default_connection", "file_path": file_path, "technology": "Informatica"}
             
-            for line in content.split('\n'):
-                line = line.strip()
-                if '=' in line and not line.startswith('#'):
-                    key, value = line.split('=', 1)
-                    key = key.strip().upper()
-                    value = value.strip().strip('"\'')
-                    
-                    if key in ['SERVER', 'HOST']:
-                        default_conn["server"] = value
-                    elif key in ['DATABASE', 'DB_NAME']:
-                        default_conn["database"] = value
-                    elif key in ['USERNAME', 'USER']:
-                        default_conn["username"] = value
-                    elif key in ['PORT']:
-                        default_conn["port"] = value
-                    elif key in ['TYPE', 'CONNECTION_TYPE']:
-                        default_conn["connection_type"] = value
+            for key, value in pairs:
+                if key in ['SERVER', 'HOST']:
+                    default_conn["server"] = value
+                elif key in ['DATABASE', 'DB_NAME']:
+                    default_conn["database"] = value
+                elif key in ['USERNAME', 'USER']:
+                    default_conn["username"] = value
+                elif key in ['PORT']:
+                    default_conn["port"] = value
+                elif key in ['TYPE', 'CONNECTION_TYPE']:
+                    default_conn["connection_type"] = value
             
             if len(default_conn) > 3:  # More than just name, file_path, technology
                 connections["default_connection"] = default_conn
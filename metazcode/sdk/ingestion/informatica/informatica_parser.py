@@ -6,12 +6,17 @@ of Informatica workflows and mappings. It parses Informatica XML export files fo
 architectural patterns as the SSIS parser.
 """
 
+import html
+import io
 import os
 import re
+from collections import ChainMap
 from lxml import etree
-from typing import Dict, List, Tuple, Generator, Any, Optional
+from typing import Dict, List, Tuple, Generator, Any, Optional, Iterator, Union
 import logging
 import json
+from functools import lru_cache
+from itertools import islice
 
 from ...models.canonical_types import NodeType, EdgeType
 from ...models.graph import Node, Edge
@@ -21,6 +26,60 @@ from ..ssis.sql_semantics import EnhancedSqlParser, SqlSemantics, create_join_ed
 
 logger = logging.getLogger(__name__)
 
+# Workflow and mapping files are streamed with iterparse using huge_tree (exports
+# can exceed libxml2's default size limits), remove_blank_text (whitespace-only
+# text is never read) and collect_ids=False (no ID lookups are used)
+
+# Elements streamed from mapping files in the definition pass; everything else is
+# reached through these
+_MAPPING_STREAM_TAGS = ("SOURCE", "TARGET", "TRANSFORMATION", "MAPPING")
+
+# Descendant selectors compiled once and shared by every parser instance
+_XP_TASKINSTANCE = etree.XPath(".//TASKINSTANCE")
+_XP_WORKFLOWLINK = etree.XPath(".//WORKFLOWLINK")
+_XP_SESSION = etree.XPath(".//SESSION")
+_XP_SESSIONEXTENSION = etree.XPath(".//SESSIONEXTENSION")
+_XP_CONNECTIONREFERENCE = etree.XPath(".//CONNECTIONREFERENCE")
+_XP_SOURCEFIELD = etree.XPath(".//SOURCEFIELD")
+_XP_TARGETFIELD = etree.XPath(".//TARGETFIELD")
+_XP_INSTANCE = etree.XPath(".//INSTANCE")
+_XP_CONNECTOR = etree.XPath(".//CONNECTOR")
+_XP_ASSOCIATED_SOURCE_INSTANCE = etree.XPath(".//ASSOCIATED_SOURCE_INSTANCE")
+_XP_TABLEATTRIBUTE = etree.XPath(".//TABLEATTRIBUTE")
+_XP_TRANSFORMFIELD = etree.XPath(".//TRANSFORMFIELD")
+_XP_GROUP = etree.XPath(".//GROUP")
+_XP_TABLEATTRIBUTE_NAMED = etree.XPath(".//TABLEATTRIBUTE[@NAME=$name]")
+
+# Unconnected lookup calls inside expressions, e.g. :LKP.lkp_customer(ID)
+_LOOKUP_CALL_RE = re.compile(r':LKP\.(\w+)\(')
+
+_SQL_STATEMENT_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+# Operation subtype lookups used by _categorize_operation_subtype, checked in this order
+_DATA_FLOW_TYPES = frozenset({
+    "Source Qualifier", "Target Definition", "Expression", "Filter",
+    "Aggregator", "Sorter", "Joiner", "Lookup", "Router", "Union",
+    "Sequence Generator", "Update Strategy", "Normalizer", "Rank",
+    "Transaction Control", "Stored Procedure"
+})
+_CONTROL_FLOW_TYPES = frozenset({"Session", "Worklet", "Assignment", "Command", "Timer", "Event-Wait"})
+_EXECUTE_TYPES = frozenset({"Command", "Email"})
+
+
+@lru_cache(maxsize=4096)
+def _decode_expression(sql_or_expression: str) -> Tuple[str, bool]:
+    """
+    Decode HTML entities from XML (e.g., &gt; -> >, &lt; -> <, &amp; -> &) and check
+    whether the result looks like a SQL query (SELECT, INSERT, UPDATE, DELETE).
+    
+    The same expressions recur across transformations and mappings, so results are
+    cached; both values are immutable and safe to share.
+    """
+    decoded_expression = html.unescape(sql_or_expression)
+    upper_expression = decoded_expression.upper()
+    is_sql_query = any(keyword in upper_expression for keyword in _SQL_STATEMENT_KEYWORDS)
+    return decoded_expression, is_sql_query
+
 
 class CanonicalInformaticaParser:
     """
@@ -65,6 +124,30 @@ class CanonicalInformaticaParser:
         
         # Cache for parsed mapping files to avoid re-parsing
         self.mapping_cache = {}
+        
+        # Map transformation types to parser methods - using exact XML values;
+        # built once here rather than on every dispatch
+        self._transformation_parsers = {
+            "source qualifier": self._parse_source_qualifier_transformation,
+            "target definition": self._parse_target_transformation,
+            "source definition": self._parse_source_definition_transformation,
+            "expression": self._parse_expression_transformation,
+            "filter": self._parse_filter_transformation,
+            "aggregator": self._parse_aggregator_transformation,
+            "sorter": self._parse_sorter_transformation,
+            "joiner": self._parse_joiner_transformation,
+            "lookup": self._parse_lookup_transformation,
+            "router": self._parse_router_transformation,
+            "union": self._parse_union_transformation,
+            "sequence generator": self._parse_sequence_generator_transformation,
+            "update strategy": self._parse_update_strategy_transformation,
+            "normalizer": self._parse_normalizer_transformation,
+            "rank": self._parse_rank_transformation,
+            # Additional transformation types found in real-world XML
+            "custom transformation": self._parse_generic_transformation,
+            "lookup procedure": self._parse_lookup_transformation,
+            "sequence": self._parse_sequence_generator_transformation
+        }
 
     def _parse_target_platforms(self, platforms: List[str]) -> List[TargetPlatform]:
         """Parse string platform names to TargetPlatform enums."""
@@ -88,22 +171,15 @@ class CanonicalInformaticaParser:
             A standardized operation subtype: CONTROL_FLOW, DATA_FLOW, EXECUTE, or SCRIPT
         """
         # Data Flow transformations
-        data_flow_types = {
-            "Source Qualifier", "Target Definition", "Expression", "Filter", 
-            "Aggregator", "Sorter", "Joiner", "Lookup", "Router", "Union",
-            "Sequence Generator", "Update Strategy", "Normalizer", "Rank",
-            "Transaction Control", "Stored Procedure"
-        }
-        
-        if transformation_type in data_flow_types:
+        if transformation_type in _DATA_FLOW_TYPES:
             return "DATA_FLOW"
         
         # Control flow operations (workflow level)
-        elif transformation_type in ["Session", "Worklet", "Assignment", "Command", "Timer", "Event-Wait"]:
+        elif transformation_type in _CONTROL_FLOW_TYPES:
             return "CONTROL_FLOW"
         
         # Execute operations
-        elif transformation_type in ["Command", "Email"]:
+        elif transformation_type in _EXECUTE_TYPES:
             return "EXECUTE"
             
         # Default fallback
@@ -124,23 +200,15 @@ class CanonicalInformaticaParser:
             mapping_file_path: Path to the mapping XML file (if separate)
         """
         try:
-            # Parse workflow file
-            workflow_root = self._parse_xml_file(workflow_file_path)
-            
-            # Parse mapping file if provided, otherwise look for mappings in workflow file
-            mapping_root = None
-            if mapping_file_path and os.path.exists(mapping_file_path):
-                mapping_root = self._parse_xml_file(mapping_file_path)
-            else:
-                # Try to find mapping file based on workflow file name
+            # Use the mapping file if provided, otherwise infer it from the workflow file name
+            if not (mapping_file_path and os.path.exists(mapping_file_path)):
                 inferred_mapping_path = self._infer_mapping_path(workflow_file_path)
                 if inferred_mapping_path and os.path.exists(inferred_mapping_path):
-                    mapping_root = self._parse_xml_file(inferred_mapping_path)
                     mapping_file_path = inferred_mapping_path
+                else:
+                    mapping_file_path = None
             
-            yield from self._parse_informatica_project(
-                workflow_root, workflow_file_path, mapping_root, mapping_file_path
-            )
+            yield from self._parse_informatica_project(workflow_file_path, mapping_file_path)
             
         except Exception as e:
             logger.error(
@@ -148,8 +216,8 @@ class CanonicalInformaticaParser:
             )
             return
 
-    def _parse_xml_file(self, file_path: str) -> etree._Element:
-        """Parse an Informatica XML file with proper encoding handling."""
+    def _read_xml_bytes(self, file_path: str) -> bytes:
+        """Read an Informatica XML file leniently and return it re-encoded as UTF-8."""
         try:
             with open(file_path, "r", encoding="Windows-1252") as f:
                 content = f.read()
@@ -162,7 +230,7 @@ class CanonicalInformaticaParser:
         if content.startswith('\ufeff'):
             content = content[1:]
             
-        return etree.fromstring(content.encode("utf-8"))
+        return content.encode("utf-8")
 
     def _infer_mapping_path(self, workflow_file_path: str) -> Optional[str]:
         """
@@ -189,9 +257,7 @@ class CanonicalInformaticaParser:
 
     def _parse_informatica_project(
         self,
-        workflow_root: etree._Element,
         workflow_file_path: str,
-        mapping_root: Optional[etree._Element],
         mapping_file_path: Optional[str]
     ) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
         """
@@ -200,37 +266,58 @@ class CanonicalInformaticaParser:
         nodes = []
         edges = []
         
+        # Mappings only see the session connections of this workflow file, even
+        # when the parser instance is reused across files
+        self.session_connections = {}
+        
         # Parse workflows first to extract session information
-        workflow_nodes, workflow_edges = self._parse_workflows(workflow_root, workflow_file_path)
+        workflow_nodes, workflow_edges = self._parse_workflows(workflow_file_path)
         nodes.extend(workflow_nodes)
         edges.extend(workflow_edges)
         
         # Parse mappings if available
-        if mapping_root is not None:
-            mapping_nodes, mapping_edges = self._parse_mappings(mapping_root, mapping_file_path)
+        if mapping_file_path is not None:
+            mapping_nodes, mapping_edges = self._parse_mappings(mapping_file_path)
             nodes.extend(mapping_nodes)
             edges.extend(mapping_edges)
         
         yield nodes, edges
 
-    def _parse_workflows(
-        self, 
-        root: etree._Element, 
-        file_path: str
-    ) -> Tuple[List[Node], List[Edge]]:
+    def _parse_workflows(self, file_path: str) -> Tuple[List[Node], List[Edge]]:
         """
-        Parse workflow definitions from the root element.
+        Parse workflow definitions from a workflow file.
+        
+        Like mapping files, the file is streamed so that only the workflow currently
+        being parsed is held in memory, with the same lenient re-read on failure.
         """
+        try:
+            return self._stream_workflows(file_path, file_path)
+        except (etree.XMLSyntaxError, OSError) as e:
+            # libxml2 reports undecodable bytes as OSError when reading from a path
+            logger.debug(f"Re-reading {file_path} with lenient decoding: {e}")
+            return self._stream_workflows(io.BytesIO(self._read_xml_bytes(file_path)), file_path)
+
+    def _stream_workflows(self, source: Any, file_path: str) -> Tuple[List[Node], List[Edge]]:
+        """Stream WORKFLOW elements and parse each one as soon as its closing tag has been read."""
         nodes = []
         edges = []
         
-        # Find all workflow definitions
-        workflows = root.xpath(".//WORKFLOW")
-        
-        for workflow in workflows:
+        for _, workflow in etree.iterparse(
+            source,
+            events=("end",),
+            tag="WORKFLOW",
+            huge_tree=True,
+            collect_ids=False,
+            remove_blank_text=True,
+        ):
             workflow_nodes, workflow_edges = self._parse_workflow(workflow, file_path)
             nodes.extend(workflow_nodes)
             edges.extend(workflow_edges)
+            
+            # Release the parsed workflow and the already processed siblings before it
+            workflow.clear(keep_tail=True)
+            while workflow.getprevious() is not None:
+                del workflow.getparent()[0]
         
         return nodes, edges
 
@@ -274,7 +361,7 @@ class CanonicalInformaticaParser:
         nodes.append(workflow_node)
         
         # Parse task instances within the workflow
-        task_instances = workflow.xpath(".//TASKINSTANCE")
+        task_instances = _XP_TASKINSTANCE(workflow)
         for task_instance in task_instances:
             task_nodes, task_edges = self._parse_task_instance(
                 task_instance, workflow_id, file_path
@@ -283,13 +370,13 @@ class CanonicalInformaticaParser:
             edges.extend(task_edges)
         
         # Parse workflow links (execution order)
-        workflow_links = workflow.xpath(".//WORKFLOWLINK")
+        workflow_links = _XP_WORKFLOWLINK(workflow)
         for link in workflow_links:
             link_edges = self._parse_workflow_link(link, workflow_id, file_path)
             edges.extend(link_edges)
         
         # Parse sessions for connection information AND create EXECUTES edges to mappings
-        sessions = workflow.xpath(".//SESSION")
+        sessions = _XP_SESSION(workflow)
         for session in sessions:
             # Extract connection information for later use
             self._extract_session_connections(session, file_path)
@@ -437,9 +524,9 @@ class CanonicalInformaticaParser:
         connections = {}
         
         # Extract connection references from session extensions
-        session_extensions = session.xpath(".//SESSIONEXTENSION")
+        session_extensions = _XP_SESSIONEXTENSION(session)
         for ext in session_extensions:
-            conn_refs = ext.xpath(".//CONNECTIONREFERENCE")
+            conn_refs = _XP_CONNECTIONREFERENCE(ext)
             for conn_ref in conn_refs:
                 instance_name = conn_ref.get("INSTANCENAME", "")
                 connection_name = conn_ref.get("CONNECTIONNAME", "")
@@ -453,147 +540,186 @@ class CanonicalInformaticaParser:
                 "connections": connections
             }
 
-    def _parse_mappings(
-        self, 
-        root: etree._Element, 
-        file_path: str
-    ) -> Tuple[List[Node], List[Edge]]:
+    def _parse_mappings(self, file_path: str) -> Tuple[List[Node], List[Edge]]:
         """
-        Parse mapping definitions from the root element.
-        """
-        nodes = []
-        edges = []
+        Parse mapping definitions from a mapping file.
         
-        # Parse sources, targets, and transformations first (definitions)
-        source_definitions = self._parse_source_definitions(root, file_path)
-        target_definitions = self._parse_target_definitions(root, file_path)
-        transformation_definitions = self._parse_transformation_definitions(root, file_path)
+        The file is streamed with iterparse so that only the mapping currently being
+        parsed is held in memory. Files that libxml2 rejects with their declared
+        encoding are re-read leniently and streamed again.
+        """
+        try:
+            return self._stream_mappings(file_path, file_path)
+        except (etree.XMLSyntaxError, OSError) as e:
+            # libxml2 reports undecodable bytes as OSError when reading from a path
+            logger.debug(f"Re-reading {file_path} with lenient decoding: {e}")
+            return self._stream_mappings(self._read_xml_bytes(file_path), file_path)
+
+    def _iterparse_released(
+        self, source: Union[str, bytes], tag: Union[str, Tuple[str, ...]]
+    ) -> Iterator[etree._Element]:
+        """
+        Yield each streamed element, then drop the already processed siblings before it.
         
-        # Add source and target DATA_ASSET nodes to the main nodes list
-        nodes.extend(source_definitions.values())
-        nodes.extend(target_definitions.values())
+        Elements the caller keeps a reference to stay usable after leaving the tree;
+        the caller clears the ones it no longer needs.
+        """
+        for _, element in etree.iterparse(
+            io.BytesIO(source) if isinstance(source, bytes) else source,
+            events=("end",),
+            tag=tag,
+            huge_tree=True,
+            collect_ids=False,
+            remove_blank_text=True,
+        ):
+            yield element
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _stream_mappings(self, source: Union[str, bytes], file_path: str) -> Tuple[List[Node], List[Edge]]:
+        """
+        Stream a mapping file in two passes.
         
-        # Find all mapping definitions
-        mappings = root.xpath(".//MAPPING")
+        The first pass collects every SOURCE, TARGET and folder-level TRANSFORMATION
+        definition, so mappings can use definitions that appear later in the file.
+        The second pass parses each MAPPING as soon as its closing tag has been read.
+        Transformations defined inside a mapping take precedence over folder-level
+        ones and are not visible to other mappings.
+        """
+        source_definitions = {}
+        target_definitions = {}
+        transformation_definitions = {}
+        
+        for element in self._iterparse_released(source, _MAPPING_STREAM_TAGS):
+            tag = element.tag
+            if tag == "TRANSFORMATION":
+                if element.getparent().tag != "MAPPING":
+                    # Definitions stay referenced until the mappings using them are parsed
+                    self._add_transformation_definition(element, transformation_definitions)
+                    continue
+            elif tag == "SOURCE":
+                source_node = self._parse_source_definition(element, file_path)
+                if source_node is not None:
+                    source_definitions[source_node.name] = source_node
+            elif tag == "TARGET":
+                target_node = self._parse_target_definition(element, file_path)
+                if target_node is not None:
+                    target_definitions[target_node.name] = target_node
+            element.clear(keep_tail=True)
+        
+        # Add source and target DATA_ASSET nodes ahead of the mapping nodes
+        nodes = list(source_definitions.values()) + list(target_definitions.values())
+        edges = []
         
-        for mapping in mappings:
+        for mapping in self._iterparse_released(source, "MAPPING"):
+            local_definitions = {}
+            for transformation in mapping.iterchildren("TRANSFORMATION"):
+                self._add_transformation_definition(transformation, local_definitions)
+            
             mapping_nodes, mapping_edges = self._parse_mapping(
-                mapping, file_path, source_definitions, target_definitions, transformation_definitions
+                mapping, file_path, source_definitions, target_definitions,
+                ChainMap(local_definitions, transformation_definitions)
             )
             nodes.extend(mapping_nodes)
             edges.extend(mapping_edges)
+            mapping.clear(keep_tail=True)
         
         return nodes, edges
 
-    def _parse_source_definitions(self, root: etree._Element, file_path: str) -> Dict[str, Node]:
-        """Parse source definitions and return them as Node objects."""
-        sources = {}
-        source_elements = root.xpath(".//SOURCE")
-        
-        for source in source_elements:
-            source_name = source.get("NAME", "")
-            if source_name:
-                source_id = f"data_asset:source:{source_name}"
-                
-                # Create source context for traceability
-                source_context = SourceContext.create_node_traceability(
-                    source_file_path=file_path,
-                    source_file_type="xml",
-                    xml_path=f"//SOURCE[@NAME='{source_name}']",
-                    line_number=source.sourceline
-                    ,
+    def _parse_source_definition(self, source: etree._Element, file_path: str) -> Optional[Node]:
+        """Parse a source definition and return it as a Node object."""
+        source_name = source.get("NAME", "")
+        if not source_name:
+            return None
+        
+        source_id = f"data_asset:source:{source_name}"
+        
+        # Create source context for traceability
+        source_context = SourceContext.create_node_traceability(
+            source_file_path=file_path,
+            source_file_type="xml",
+            xml_path=f"//SOURCE[@NAME='{source_name}']",
+            line_number=source.sourceline
+            ,
             technology="Informatica"
         )
-                
-                # Parse field information
-                fields = self._parse_source_fields(source)
-                
-                # Create DATA_ASSET node for source
-                source_node = Node(
-                    node_id=source_id,
-                    node_type=NodeType.DATA_ASSET.value,
-                    name=source_name,
-                    properties={
-                        "name": source_name,
-                        "database_type": source.get("DATABASETYPE", ""),
-                        "description": source.get("DESCRIPTION", ""),
-                        "owner_name": source.get("OWNERNAME", ""),
-                        "fields": fields,
-                        "source_context": source_context,
-                        "informatica_type": "source",
-                        "asset_type": "table"
-                    }
-                )
-                
-                sources[source_name] = source_node
         
-        return sources
+        # Parse field information
+        fields = self._parse_source_fields(source)
+        
+        # Create DATA_ASSET node for source
+        return Node(
+            node_id=source_id,
+            node_type=NodeType.DATA_ASSET.value,
+            name=source_name,
+            properties={
+                "name": source_name,
+                "database_type": source.get("DATABASETYPE", ""),
+                "description": source.get("DESCRIPTION", ""),
+                "owner_name": source.get("OWNERNAME", ""),
+                "fields": fields,
+                "source_context": source_context,
+                "informatica_type": "source",
+                "asset_type": "table"
+            }
+        )
 
-    def _parse_target_definitions(self, root: etree._Element, file_path: str) -> Dict[str, Node]:
-        """Parse target definitions and return them as Node objects."""
-        targets = {}
-        target_elements = root.xpath(".//TARGET")
-        
-        for target in target_elements:
-            target_name = target.get("NAME", "")
-            if target_name:
-                target_id = f"data_asset:target:{target_name}"
-                
-                # Create source context for traceability
-                source_context = SourceContext.create_node_traceability(
-                    source_file_path=file_path,
-                    source_file_type="xml",
-                    xml_path=f"//TARGET[@NAME='{target_name}']",
-                    line_number=target.sourceline
-                    ,
+    def _parse_target_definition(self, target: etree._Element, file_path: str) -> Optional[Node]:
+        """Parse a target definition and return it as a Node object."""
+        target_name = target.get("NAME", "")
+        if not target_name:
+            return None
+        
+        target_id = f"data_asset:target:{target_name}"
+        
+        # Create source context for traceability
+        source_context = SourceContext.create_node_traceability(
+            source_file_path=file_path,
+            source_file_type="xml",
+            xml_path=f"//TARGET[@NAME='{target_name}']",
+            line_number=target.sourceline
+            ,
             technology="Informatica"
         )
-                
-                # Parse field information
-                fields = self._parse_target_fields(target)
-                
-                # Create DATA_ASSET node for target
-                target_node = Node(
-                    node_id=target_id,
-                    node_type=NodeType.DATA_ASSET.value,
-                    name=target_name,
-                    properties={
-                        "name": target_name,
-                        "database_type": target.get("DATABASETYPE", ""),
-                        "description": target.get("DESCRIPTION", ""),
-                        "fields": fields,
-                        "source_context": source_context,
-                        "informatica_type": "target",
-                        "asset_type": "table"
-                    }
-                )
-                
-                targets[target_name] = target_node
         
-        return targets
-
-    def _parse_transformation_definitions(self, root: etree._Element, file_path: str) -> Dict[str, Dict]:
-        """Parse transformation definitions and return them as a lookup dictionary."""
-        transformations = {}
-        transformation_elements = root.xpath(".//TRANSFORMATION")
-        
-        for transformation in transformation_elements:
-            transformation_name = transformation.get("NAME", "")
-            if transformation_name:
-                transformations[transformation_name] = {
-                    "element": transformation,
-                    "name": transformation_name,
-                    "type": transformation.get("TYPE", ""),
-                    "description": transformation.get("DESCRIPTION", ""),
-                    "is_reusable": transformation.get("REUSABLE", "NO") == "YES"
-                }
+        # Parse field information
+        fields = self._parse_target_fields(target)
         
-        return transformations
+        # Create DATA_ASSET node for target
+        return Node(
+            node_id=target_id,
+            node_type=NodeType.DATA_ASSET.value,
+            name=target_name,
+            properties={
+                "name": target_name,
+                "database_type": target.get("DATABASETYPE", ""),
+                "description": target.get("DESCRIPTION", ""),
+                "fields": fields,
+                "source_context": source_context,
+                "informatica_type": "target",
+                "asset_type": "table"
+            }
+        )
+
+    def _add_transformation_definition(
+        self, transformation: etree._Element, transformations: Dict[str, Dict]
+    ) -> None:
+        """Add a transformation definition to the lookup dictionary."""
+        attrs = transformation.attrib
+        transformation_name = attrs.get("NAME", "")
+        if transformation_name:
+            transformations[transformation_name] = {
+                "element": transformation,
+                "name": transformation_name,
+                "type": attrs.get("TYPE", ""),
+                "description": attrs.get("DESCRIPTION", ""),
+                "is_reusable": attrs.get("REUSABLE", "NO") == "YES"
+            }
 
     def _parse_source_fields(self, source: etree._Element) -> List[Dict]:
         """Parse fields from a source definition."""
         fields = []
-        source_fields = source.xpath(".//SOURCEFIELD")
+        source_fields = _XP_SOURCEFIELD(source)
         
         for field in source_fields:
             # Use Informatica type mapper to enrich field properties if available
@@ -631,7 +757,7 @@ class CanonicalInformaticaParser:
     def _parse_target_fields(self, target: etree._Element) -> List[Dict]:
         """Parse fields from a target definition."""
         fields = []
-        target_fields = target.xpath(".//TARGETFIELD")
+        target_fields = _XP_TARGETFIELD(target)
         
         for field in target_fields:
             # Use Informatica type mapper to enrich field properties if available
@@ -720,7 +846,7 @@ class CanonicalInformaticaParser:
         session_context = self.session_connections.get(mapping_name, {})
         
         # Parse transformation instances within the mapping
-        instances = mapping.xpath(".//INSTANCE")
+        instances = _XP_INSTANCE(mapping)
         instance_nodes = {}  # Keep track of instance nodes for connector parsing
         
         for instance in instances:
@@ -737,7 +863,7 @@ class CanonicalInformaticaParser:
                     instance_nodes[instance_name] = instance_nodes_list[0]
         
         # Parse connectors (data flow connections)
-        connectors = mapping.xpath(".//CONNECTOR")
+        connectors = _XP_CONNECTOR(mapping)
         for connector in connectors:
             connector_edges = self._parse_connector(
                 connector, mapping_id, file_path, instance_nodes
@@ -757,9 +883,10 @@ class CanonicalInformaticaParser:
         """
         Parse a transformation instance and dispatch to specific transformation parsers.
         """
-        instance_name = instance.get("INSTANCENAME") or instance.get("NAME", "UnknownInstance")
-        transformation_name = instance.get("TRANSFORMATION_NAME") or instance.get("TRANSFORMATIONNAME", "")
-        transformation_type = instance.get("TRANSFORMATION_TYPE") or instance.get("TRANSFORMATIONTYPE", "")
+        attrs = instance.attrib
+        instance_name = attrs.get("INSTANCENAME") or attrs.get("NAME", "UnknownInstance")
+        transformation_name = attrs.get("TRANSFORMATION_NAME") or attrs.get("TRANSFORMATIONNAME", "")
+        transformation_type = attrs.get("TRANSFORMATION_TYPE") or attrs.get("TRANSFORMATIONTYPE", "")
         
         # Get transformation definition if available
         transformation_def = transformation_definitions.get(transformation_name, {})
@@ -776,7 +903,8 @@ class CanonicalInformaticaParser:
         
         # Dispatch to specific transformation parser based on type
         return self._dispatch_transformation_parser(
-            instance, mapping_id, file_path, transformation_def, session_context
+            instance, mapping_id, file_path, transformation_def, session_context,
+            transformation_type
         )
 
     def _get_effective_instance_name(self, instance: etree._Element) -> str:
@@ -785,8 +913,9 @@ class CanonicalInformaticaParser:
         This handles both INSTANCENAME and NAME attributes and provides fallbacks.
         """
         # Check both INSTANCENAME and NAME attributes (Informatica uses both)
-        instance_name = instance.get("INSTANCENAME", "") or instance.get("NAME", "")
-        transformation_name = instance.get("TRANSFORMATIONNAME", "") or instance.get("TRANSFORMATION_NAME", "")
+        attrs = instance.attrib
+        instance_name = attrs.get("INSTANCENAME", "") or attrs.get("NAME", "")
+        transformation_name = attrs.get("TRANSFORMATIONNAME", "") or attrs.get("TRANSFORMATION_NAME", "")
         return instance_name or transformation_name or "UnknownInstance"
     
     def _dispatch_transformation_parser(
@@ -795,49 +924,23 @@ class CanonicalInformaticaParser:
         mapping_id: str,
         file_path: str,
         transformation_def: Dict[str, Any],
-        session_context: Dict[str, Any]
+        session_context: Dict[str, Any],
+        transformation_type: str
     ) -> Tuple[List[Node], List[Edge]]:
         """
         Dispatch to the appropriate transformation parser based on transformation type.
         This follows the same pattern as the SSIS parser's component dispatcher.
         
         CRITICAL: Use TRANSFORMATION_TYPE from the INSTANCE XML tag, not transformation_def.
-        This is the key to proper Informatica parsing.
+        This is the key to proper Informatica parsing. The caller has already read it
+        (TRANSFORMATION_TYPE, falling back to TRANSFORMATIONTYPE) from the instance.
         """
-        # FIXED: Read TRANSFORMATION_TYPE directly from the instance XML element
-        transformation_type = instance.get("TRANSFORMATION_TYPE", "").lower()
-        
-        # Handle both variants (TRANSFORMATION_TYPE vs TRANSFORMATIONTYPE)
-        if not transformation_type:
-            transformation_type = instance.get("TRANSFORMATIONTYPE", "").lower()
+        transformation_type = transformation_type.lower()
         
         logger.debug(f"Dispatching transformation instance: {instance.get('INSTANCENAME', 'Unknown')} "
                     f"with type: '{transformation_type}'")
         
-        # Map transformation types to parser methods - using exact XML values
-        parser_map = {
-            "source qualifier": self._parse_source_qualifier_transformation,
-            "target definition": self._parse_target_transformation,
-            "source definition": self._parse_source_definition_transformation,
-            "expression": self._parse_expression_transformation,
-            "filter": self._parse_filter_transformation,
-            "aggregator": self._parse_aggregator_transformation,
-            "sorter": self._parse_sorter_transformation,
-            "joiner": self._parse_joiner_transformation,
-            "lookup": self._parse_lookup_transformation,
-            "router": self._parse_router_transformation,
-            "union": self._parse_union_transformation,
-            "sequence generator": self._parse_sequence_generator_transformation,
-            "update strategy": self._parse_update_strategy_transformation,
-            "normalizer": self._parse_normalizer_transformation,
-            "rank": self._parse_rank_transformation,
-            # Additional transformation types found in real-world XML
-            "custom transformation": self._parse_generic_transformation,
-            "lookup procedure": self._parse_lookup_transformation,
-            "sequence": self._parse_sequence_generator_transformation
-        }
-        
-        parser_method = parser_map.get(transformation_type)
+        parser_method = self._transformation_parsers.get(transformation_type)
         if parser_method:
             return parser_method(instance, mapping_id, file_path, transformation_def, session_context)
         else:
@@ -914,7 +1017,7 @@ class CanonicalInformaticaParser:
                                 f"({from_field} -> {to_field})")
                 else:
                     logger.debug(f"Source node not found for WRITES_TO: {from_instance}. "
-                               f"Available nodes: {list(instance_nodes.keys())[:5]}...")
+                               f"Available nodes: {list(islice(instance_nodes, 5))}...")
             
             # Handle Source Definition to Source Qualifier flow  
             elif from_instancetype == "Source Definition" and to_instancetype == "Source Qualifier":
@@ -985,7 +1088,7 @@ class CanonicalInformaticaParser:
                                 f"({from_field} -> {to_field})")
                 else:
                     logger.debug(f"Missing nodes for connector: {from_instance} -> {to_instance}. "
-                               f"Available: {list(instance_nodes.keys())[:3]}...")
+                               f"Available: {list(islice(instance_nodes, 3))}...")
         else:
             logger.warning(f"Incomplete connector: FROMINSTANCE='{from_instance}' "
                           f"TOINSTANCE='{to_instance}'")
@@ -1006,13 +1109,7 @@ class CanonicalInformaticaParser:
                 "has_sql": False
             }
         
-        # Decode HTML entities from XML (e.g., &gt; -> >, &lt; -> <, &amp; -> &)
-        import html
-        decoded_expression = html.unescape(sql_or_expression)
-        
-        # Check if this looks like a SQL query (SELECT, INSERT, UPDATE, DELETE)
-        sql_keywords = ["SELECT", "INSERT", "UPDATE", "DELETE"]
-        is_sql_query = any(keyword in decoded_expression.upper() for keyword in sql_keywords)
+        decoded_expression, is_sql_query = _decode_expression(sql_or_expression)
         
         if is_sql_query:
             # Parse as SQL query
@@ -1084,7 +1181,7 @@ class CanonicalInformaticaParser:
         
         # CRITICAL FIX: Extract associated source from INSTANCE XML tag, not transformation definition
         associated_source = ""
-        associated_source_elements = instance.xpath(".//ASSOCIATED_SOURCE_INSTANCE")
+        associated_source_elements = _XP_ASSOCIATED_SOURCE_INSTANCE(instance)
         if associated_source_elements:
             associated_source = associated_source_elements[0].get("NAME", "")
             logger.info(f"Found ASSOCIATED_SOURCE_INSTANCE: {associated_source} "
@@ -1096,11 +1193,9 @@ class CanonicalInformaticaParser:
         
         if transformation_element is not None:
             # Extract SQL query from transformation definition
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
-            for attr in table_attributes:
-                if attr.get("NAME") == "Sql Query":
-                    sql_query = attr.get("VALUE", "")
-                    break
+            table_attributes = _XP_TABLEATTRIBUTE_NAMED(transformation_element, name="Sql Query")
+            if table_attributes:
+                sql_query = table_attributes[0].get("VALUE", "")
         
         # Parse SQL semantics using the enhanced SQL parser
         sql_semantics = self.sql_parser.parse_sql_semantics(sql_query)
@@ -1167,7 +1262,7 @@ class CanonicalInformaticaParser:
         Parse Source Definition instance.
         
         Source Definition instances don't create operation nodes - they are represented
-        as DATA_ASSET nodes created in _parse_source_definitions. This is a passthrough.
+        as DATA_ASSET nodes created in _parse_source_definition. This is a passthrough.
         """
         # Source definitions are already handled as DATA_ASSET nodes
         # No additional operation nodes needed for source definition instances
@@ -1216,29 +1311,26 @@ class CanonicalInformaticaParser:
         
         # Extract expressions and lookups from transformation definition
         expressions = {}
-        unconnected_lookups = []
         combined_expressions = []  # For SQL semantics analysis
         
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse transformation fields for expressions
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 field_name = field.get("NAME", "")
                 expression = field.get("EXPRESSION", "")
                 if expression:
                     expressions[field_name] = expression
                     combined_expressions.append(expression)
-                    
-                    # Check for unconnected lookup calls in expression
-                    lookup_pattern = r':LKP\.(\w+)\('
-                    lookup_matches = re.findall(lookup_pattern, expression)
-                    for lookup_name in lookup_matches:
-                        if lookup_name not in unconnected_lookups:
-                            unconnected_lookups.append(lookup_name)
         
-        # Extract SQL semantics from expressions
         combined_expression_text = " | ".join(combined_expressions) if combined_expressions else ""
+        
+        # Check for unconnected lookup calls in all expressions with one scan; a call
+        # cannot span the " | " separator, so matches map back to single expressions
+        unconnected_lookups = list(dict.fromkeys(_LOOKUP_CALL_RE.findall(combined_expression_text)))
+        
+        # Extract SQL semantics from expressions
         sql_semantics_result = self._extract_sql_semantics(
             combined_expression_text, 
             f"Expression transformation: {instance_name}"
@@ -1325,7 +1417,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse table attributes for join properties
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -1335,7 +1427,7 @@ class CanonicalInformaticaParser:
                     join_type = attr_value
             
             # Parse transformation fields to identify master and detail
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 port_type = field.get("PORTTYPE", "")
                 if port_type == "INPUT" and "MASTER" in port_type:
@@ -1413,7 +1505,7 @@ class CanonicalInformaticaParser:
         
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
-            group_elements = transformation_element.xpath(".//GROUP")
+            group_elements = _XP_GROUP(transformation_element)
             for group in group_elements:
                 group_name = group.get("NAME", "")
                 group_type = group.get("TYPE", "")
@@ -1501,7 +1593,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse table attributes for lookup properties
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -1641,11 +1733,9 @@ class CanonicalInformaticaParser:
         filter_condition = ""
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
-            for attr in table_attributes:
-                if attr.get("NAME") == "Filter Condition":
-                    filter_condition = attr.get("VALUE", "")
-                    break
+            table_attributes = _XP_TABLEATTRIBUTE_NAMED(transformation_element, name="Filter Condition")
+            if table_attributes:
+                filter_condition = table_attributes[0].get("VALUE", "")
         
         # Extract SQL semantics from filter condition
         sql_semantics_result = self._extract_sql_semantics(
@@ -1715,7 +1805,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse transformation fields to identify aggregations and group by
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 field_name = field.get("NAME", "")
                 port_type = field.get("PORTTYPE", "")
@@ -1802,7 +1892,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse table attributes for sorter properties
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -1814,7 +1904,7 @@ class CanonicalInformaticaParser:
                     sort_origin = attr_value.lower()
             
             # Parse transformation fields to identify sort keys
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 field_name = field.get("NAME", "")
                 sort_order = field.get("SORTORDER", "")
@@ -1887,7 +1977,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse table attributes for union properties
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -1895,7 +1985,7 @@ class CanonicalInformaticaParser:
                     union_all = attr_value.upper() == "YES"
             
             # Parse transformation fields to identify union groups
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 field_name = field.get("NAME", "")
                 group_id = field.get("GROUP", "")
@@ -1968,7 +2058,7 @@ class CanonicalInformaticaParser:
         
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -2044,7 +2134,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse table attributes for update strategy properties
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -2117,7 +2207,7 @@ class CanonicalInformaticaParser:
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
             # Parse table attributes for normalizer properties
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -2127,7 +2217,7 @@ class CanonicalInformaticaParser:
                     reset_level = attr_value
             
             # Parse transformation fields to identify normalizable columns
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 field_name = field.get("NAME", "")
                 field_type = field.get("FIELDTYPE", "")
@@ -2201,7 +2291,7 @@ class CanonicalInformaticaParser:
         
         transformation_element = transformation_def.get("element")
         if transformation_element is not None:
-            table_attributes = transformation_element.xpath(".//TABLEATTRIBUTE")
+            table_attributes = _XP_TABLEATTRIBUTE(transformation_element)
             for attr in table_attributes:
                 attr_name = attr.get("NAME", "")
                 attr_value = attr.get("VALUE", "")
@@ -2213,7 +2303,7 @@ class CanonicalInformaticaParser:
                     top_bottom = attr_value
             
             # Parse transformation fields to identify group by
-            transform_fields = transformation_element.xpath(".//TRANSFORMFIELD")
+            transform_fields = _XP_TRANSFORMFIELD(transformation_element)
             for field in transform_fields:
                 port_type = field.get("PORTTYPE", "")
                 if port_type == "GROUP BY":
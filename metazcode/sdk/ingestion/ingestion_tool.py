@@ -1,9 +1,24 @@
+import os
+import re
+import fnmatch
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Generator, Tuple
+from typing import Dict, Iterable, List, Generator, Optional, Pattern, Tuple
 
 from metazcode.sdk.models.graph import Node, Edge
 
+# Projects whose files add up to fewer bytes than this are parsed in-process
+# unless a worker count is given; below it, starting worker processes costs
+# more than the parsing itself
+PARALLEL_PARSE_THRESHOLD = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=128)
+def _compile_glob(file_pattern: str) -> Pattern[str]:
+    """Translate a shell-style file pattern to a compiled regex once per pattern."""
+    return re.compile(fnmatch.translate(os.path.normcase(file_pattern)))
+
 
 class IngestionTool(ABC):
     """Abstract base class for all ingestion tools."""
@@ -21,6 +36,62 @@ class IngestionTool(ABC):
         """
         return list(self.root_path.rglob(file_pattern))
 
+    def discover_all(self, file_patterns: Iterable[str]) -> Dict[str, List[Path]]:
+        """
+        Discover files for several patterns with a single walk of root_path.
+
+        Each file name is tested against every pattern, so a file can appear
+        under more than one pattern. Files are listed in the same order
+        discover_files would return them for each pattern.
+        """
+        matchers = [(pattern, _compile_glob(pattern).match) for pattern in file_patterns]
+        buckets: Dict[str, List[Path]] = {pattern: [] for pattern, _ in matchers}
+
+        # Depth-first walk with an explicit stack; DirEntry.is_dir() reuses the
+        # type returned by the directory read, so files are not stat'd again
+        stack = [os.fspath(self.root_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    sub_directories = []
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like rglob, do not descend into symlinked directories
+                            if not entry.is_symlink():
+                                sub_directories.append(entry.path)
+                            continue
+                        normalized = os.path.normcase(entry.name)
+                        for pattern, match in matchers:
+                            if match(normalized):
+                                buckets[pattern].append(Path(entry.path))
+            except OSError:
+                continue
+            # Reversed so sub-directories are visited in directory order
+            stack.extend(reversed(sub_directories))
+
+        return buckets
+
+    def parse_worker_count(
+        self, files: List[Path], max_workers: Optional[int] = None
+    ) -> int:
+        """
+        Return the number of worker processes to parse files with; 1 means in-process.
+
+        With max_workers None, a pool of os.cpu_count() workers is used only
+        when the files total at least PARALLEL_PARSE_THRESHOLD bytes.
+        """
+        if max_workers is None:
+            total_bytes = 0
+            for file_path in files:
+                try:
+                    total_bytes += os.stat(file_path).st_size
+                except OSError:
+                    continue
+            if total_bytes < PARALLEL_PARSE_THRESHOLD:
+                return 1
+            max_workers = os.cpu_count() or 1
+        return max(1, min(max_workers, len(files)))
+
     @abstractmethod
     def ingest(self) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
         """
@@ -0,0 +1,64 @@
+"""
+Pure string helpers for the enhanced SQL semantics parser.
+
+Every function here takes and returns only builtin types so the module can be
+compiled ahead of time with mypyc:
+
+    mypyc metazcode/sdk/ingestion/ssis/_sql_semantics_fast.py
+
+When the compiled extension sits next to this file Python imports it in place
+of the source, so sql_semantics picks it up without any code changes; without
+it the pure-Python version below is used.
+"""
+
+import re
+from typing import List, Optional
+
+_SELECT_CLAUSE_RE = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
+
+
+def select_clause(sql: str) -> Optional[str]:
+    """
+    Return the text between SELECT and the first FROM of a normalized statement.
+
+    Equivalent to _SELECT_CLAUSE_RE on the single-spaced output of
+    EnhancedSqlParser._normalize_sql, but uses plain str.find scans instead of
+    non-greedy backtracking over long column lists.
+    """
+    upper = sql.upper()
+    if len(upper) != len(sql):
+        # Case mapping changed the length (e.g. 'ß' -> 'SS'); offsets would not line up
+        match = _SELECT_CLAUSE_RE.search(sql)
+        return match.group(1).strip() if match else None
+
+    start = upper.find('SELECT ')
+    if start < 0:
+        return None
+    start += 7  # len('SELECT ')
+    end = upper.find(' FROM', start)
+    if end < 0:
+        return None
+    return sql[start:end].strip()
+
+
+def split_select_columns(select_clause: str) -> List[str]:
+    """Split a SELECT clause on top-level commas, ignoring commas inside parentheses."""
+    columns: List[str] = []
+    paren_depth = 0
+    start = 0
+
+    for index, char in enumerate(select_clause):
+        if char == '(':
+            paren_depth += 1
+        elif char == ')':
+            paren_depth -= 1
+        elif char == ',' and paren_depth == 0:
+            columns.append(select_clause[start:index].strip())
+            start = index + 1
+
+    # Add the last column
+    last_column = select_clause[start:].strip()
+    if last_column:
+        columns.append(last_column)
+
+    return columns
@@ -7,14 +7,41 @@ SQL semantics including JOIN relationships, column aliases, and query structure
 for migration purposes.
 """
 
+import os
 import re
+import sys
+import functools
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import multiprocessing
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from ._sql_semantics_fast import select_clause as _select_clause, split_select_columns
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct SQL statements kept in the parsed-semantics cache
+SQL_SEMANTICS_CACHE_SIZE = 256
+
+# Statements handed to each worker per round-trip in EnhancedSqlParser.parse_many
+PARSE_MANY_CHUNKSIZE = 64
+
+# Precompiled clause patterns shared by every EnhancedSqlParser instance
+_FROM_RE = re.compile(
+    r'FROM\s+(?:\[?([^\s\[\]\.]+)\]?\.)?(?:\[?([^\s\[\]\.]+)\]?)(?:\s+(?:AS\s+)?([^\s]+))?',
+    re.IGNORECASE,
+)
+_JOIN_TABLE_RE = re.compile(
+    r'(?:INNER\s+|LEFT\s+|RIGHT\s+|FULL\s+OUTER\s+|CROSS\s+)?JOIN\s+(?:\[?([^\s\[\]\.]+)\]?\.)?(?:\[?([^\s\[\]\.]+)\]?)(?:\s+(?:AS\s+)?([^\s]+))?',
+    re.IGNORECASE,
+)
+_JOIN_ON_RE = re.compile(
+    r'((?:INNER\s+|LEFT\s+|RIGHT\s+|FULL\s+OUTER\s+|CROSS\s+)?JOIN)\s+(?:\[?([^\s\[\]\.]+)\]?\.)?(?:\[?([^\s\[\]\.]+)\]?)(?:\s+(?:AS\s+)?([^\s]+))?\s+ON\s+([^$]+?)(?=\s*(?:INNER|LEFT|RIGHT|FULL|CROSS|WHERE|ORDER|GROUP|HAVING|$))',
+    re.IGNORECASE | re.DOTALL,
+)
+
 class JoinType(str, Enum):
     """Supported SQL JOIN types."""
     INNER = "INNER JOIN"
@@ -121,10 +148,104 @@ class SqlSemantics:
                 "column_count": len(self.columns),
                 "has_aliases": any(c.alias for c in self.columns),
                 "has_joins": len(self.joins) > 0,
-                "join_types": list(set(j.join_type.value for j in self.joins))
+                "join_types": list(dict.fromkeys(j.join_type.value for j in self.joins))
             }
         }
 
+def _shallow_copy(instance: Any) -> Any:
+    """Shallow-copy a plain dataclass instance without copy.copy's reduce protocol."""
+    clone = object.__new__(type(instance))
+    clone.__dict__.update(instance.__dict__)
+    return clone
+
+
+def _copy_semantics(semantics: SqlSemantics) -> SqlSemantics:
+    """
+    Copy the dataclasses making up parsed semantics.
+    
+    Strings and JoinType members are immutable and shared. A table referenced
+    from both the table list and a join stays a single object in the copy,
+    as it would with copy.deepcopy.
+    """
+    table_copies: Dict[int, TableReference] = {}
+    
+    def copy_table(table: TableReference) -> TableReference:
+        table_copy = table_copies.get(id(table))
+        if table_copy is None:
+            table_copy = table_copies[id(table)] = _shallow_copy(table)
+        return table_copy
+    
+    joins = []
+    for join in semantics.joins:
+        join_copy = _shallow_copy(join)
+        join_copy.left_table = copy_table(join.left_table)
+        join_copy.right_table = copy_table(join.right_table)
+        joins.append(join_copy)
+    
+    semantics_copy = _shallow_copy(semantics)
+    semantics_copy.tables = [copy_table(table) for table in semantics.tables]
+    semantics_copy.joins = joins
+    semantics_copy.columns = [_shallow_copy(column) for column in semantics.columns]
+    return semantics_copy
+
+
+class _SqlSemanticsCache:
+    """
+    Bounded LRU cache of parsed SQL semantics keyed by the raw statement text.
+
+    SSIS and Informatica projects repeat the same SQL across packages, tasks and
+    sessions, so re-running the regex pipeline for every occurrence is wasted work.
+    Most statements are seen only once, so entries are stored as parsed and only
+    hits are copied, which keeps a miss as cheap as an uncached parse. Callers
+    treat parsed semantics as read-only; the copy keeps one hit's caller from
+    seeing another's changes.
+    """
+
+    def __init__(self, maxsize: int = SQL_SEMANTICS_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, SqlSemantics]" = OrderedDict()
+
+    def get(self, sql_query: str) -> Optional[SqlSemantics]:
+        """Return a private copy of the cached semantics, or None on a miss."""
+        semantics = self._entries.get(sql_query)
+        if semantics is None:
+            return None
+        self._entries.move_to_end(sql_query)
+        return _copy_semantics(semantics)
+
+    def put(self, sql_query: str, semantics: SqlSemantics) -> None:
+        """Store the semantics, evicting the least recently used entry."""
+        self._entries[sql_query] = semantics
+        self._entries.move_to_end(sql_query)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_semantics_cache = _SqlSemanticsCache()
+
+
+def _intern(identifier: Optional[str]) -> Optional[str]:
+    """Intern a table/alias/column identifier so repeats across statements share one object."""
+    return sys.intern(identifier) if identifier else identifier
+
+
+@functools.cache
+def _shared_parser() -> "EnhancedSqlParser":
+    """One EnhancedSqlParser per process; the parser keeps no per-statement state."""
+    return EnhancedSqlParser()
+
+
+def _parse_one(sql_query: str) -> SqlSemantics:
+    """Worker entry point for EnhancedSqlParser.parse_many (must be picklable)."""
+    return _shared_parser().parse_sql_semantics(sql_query)
+
 class EnhancedSqlParser:
     """
     Enhanced SQL parser that captures complete semantics for migration.
@@ -153,13 +274,49 @@ class EnhancedSqlParser:
         if not sql_query or not isinstance(sql_query, str):
             return SqlSemantics("", [], [], [])
         
+        cached = _semantics_cache.get(sql_query)
+        if cached is not None:
+            return cached
+        
+        semantics = self._parse_uncached(sql_query)
+        _semantics_cache.put(sql_query, semantics)
+        return semantics
+    
+    def parse_many(
+        self, queries: Iterable[str], workers: Optional[int] = None
+    ) -> List[SqlSemantics]:
+        """
+        Parse many SQL statements, fanning out across a process pool.
+        
+        Parsing is pure and CPU-bound, so large batches (e.g. every SQL command
+        in a project) scale with the number of cores. Small batches, or
+        workers=1, are parsed in-process where the statement cache applies.
+        
+        Args:
+            queries: SQL query strings to parse
+            workers: Number of worker processes (defaults to os.cpu_count())
+            
+        Returns:
+            SqlSemantics objects in the same order as the input queries
+        """
+        queries = list(queries)
+        workers = workers or os.cpu_count() or 1
+        
+        if workers <= 1 or len(queries) <= PARSE_MANY_CHUNKSIZE:
+            return [self.parse_sql_semantics(query) for query in queries]
+        
+        with multiprocessing.Pool(workers) as pool:
+            return list(pool.imap(_parse_one, queries, chunksize=PARSE_MANY_CHUNKSIZE))
+    
+    def _parse_uncached(self, sql_query: str) -> SqlSemantics:
+        """Run the full regex-based extraction pipeline for a single statement."""
         # Clean and normalize the SQL
         sql = self._normalize_sql(sql_query)
         
         try:
             tables = self._extract_table_references(sql)
             joins = self._extract_join_relationships(sql, tables)
-            columns = self._extract_column_expressions(sql, tables)
+            columns = self._extract_column_expressions(_select_clause(sql), tables)
             where_clause = self._extract_where_clause(sql)
             
             semantics = SqlSemantics(
@@ -193,25 +350,18 @@ class EnhancedSqlParser:
         tables = []
         
         # FROM clause
-        from_pattern = r'FROM\s+(?:\[?([^\s\[\]\.]+)\]?\.)?(?:\[?([^\s\[\]\.]+)\]?)(?:\s+(?:AS\s+)?([^\s]+))?'
-        from_match = re.search(from_pattern, sql, re.IGNORECASE)
+        from_match = _FROM_RE.search(sql)
         if from_match:
-            schema = from_match.group(1)
-            table_name = from_match.group(2) or from_match.group(1)  # Handle single name case
-            alias = from_match.group(3)
+            schema, table_name, alias = from_match.groups()
+            if not table_name:  # Single table name rather than Schema.Table
+                schema, table_name = None, schema
             
-            if from_match.group(2):  # Schema.Table format
-                schema = from_match.group(1)
-                table_name = from_match.group(2)
-            else:  # Single table name
-                schema = None
-                table_name = from_match.group(1)
-            
-            tables.append(TableReference(name=table_name, alias=alias, schema=schema))
+            tables.append(TableReference(
+                name=_intern(table_name), alias=_intern(alias), schema=_intern(schema)
+            ))
         
         # JOIN clauses
-        join_pattern = r'(?:INNER\s+|LEFT\s+|RIGHT\s+|FULL\s+OUTER\s+|CROSS\s+)?JOIN\s+(?:\[?([^\s\[\]\.]+)\]?\.)?(?:\[?([^\s\[\]\.]+)\]?)(?:\s+(?:AS\s+)?([^\s]+))?'
-        join_matches = re.findall(join_pattern, sql, re.IGNORECASE)
+        join_matches = _JOIN_TABLE_RE.findall(sql)
         
         for schema, table_name, alias in join_matches:
             if not table_name and schema:  # Single name case
@@ -219,7 +369,9 @@ class EnhancedSqlParser:
                 schema = None
             
             if table_name:
-                tables.append(TableReference(name=table_name, alias=alias, schema=schema))
+                tables.append(TableReference(
+                    name=_intern(table_name), alias=_intern(alias), schema=_intern(schema)
+                ))
         
         return tables
     
@@ -227,10 +379,17 @@ class EnhancedSqlParser:
         """Extract JOIN relationships with conditions."""
         joins = []
         
-        # Pattern to match JOIN ... ON conditions
-        join_pattern = r'((?:INNER\s+|LEFT\s+|RIGHT\s+|FULL\s+OUTER\s+|CROSS\s+)?JOIN)\s+(?:\[?([^\s\[\]\.]+)\]?\.)?(?:\[?([^\s\[\]\.]+)\]?)(?:\s+(?:AS\s+)?([^\s]+))?\s+ON\s+([^$]+?)(?=\s*(?:INNER|LEFT|RIGHT|FULL|CROSS|WHERE|ORDER|GROUP|HAVING|$))'
+        join_matches = _JOIN_ON_RE.findall(sql)
+        if not join_matches:
+            return joins
         
-        join_matches = re.findall(join_pattern, sql, re.IGNORECASE | re.DOTALL)
+        # The left side of every JOIN is the FROM table; resolve it once
+        left_table = tables[0] if tables else TableReference(name="Unknown")
+        
+        # First reference wins when the same table is joined more than once
+        tables_by_name: Dict[str, TableReference] = {}
+        for table in tables:
+            tables_by_name.setdefault(table.name, table)
         
         for join_type_raw, schema, table_name, alias, condition in join_matches:
             # Normalize join type
@@ -249,17 +408,11 @@ class EnhancedSqlParser:
                 schema = None
             
             # Find matching table references
-            right_table = None
-            for table in tables:
-                if table.name == table_name:
-                    right_table = table
-                    break
-            
+            right_table = tables_by_name.get(table_name)
             if not right_table:
-                right_table = TableReference(name=table_name, alias=alias, schema=schema)
-            
-            # Get left table (FROM table)
-            left_table = tables[0] if tables else TableReference(name="Unknown")
+                right_table = TableReference(
+                    name=_intern(table_name), alias=_intern(alias), schema=_intern(schema)
+                )
             
             joins.append(JoinRelationship(
                 join_type=join_type,
@@ -271,17 +424,15 @@ class EnhancedSqlParser:
         
         return joins
     
-    def _extract_column_expressions(self, sql: str, tables: List[TableReference]) -> List[ColumnExpression]:
-        """Extract column expressions from SELECT clause."""
+    def _extract_column_expressions(
+        self, select_clause: Optional[str], tables: List[TableReference]
+    ) -> List[ColumnExpression]:
+        """Extract column expressions from the SELECT clause located by _select_clause."""
         columns = []
         
-        # Find SELECT clause
-        select_match = re.search(r'SELECT\s+(.*?)\s+FROM', sql, re.IGNORECASE | re.DOTALL)
-        if not select_match:
+        if select_clause is None:
             return columns
         
-        select_clause = select_match.group(1).strip()
-        
         # Split by commas (basic approach - could be enhanced for complex expressions)
         column_expressions = self._split_select_columns(select_clause)
         
@@ -300,7 +451,7 @@ class EnhancedSqlParser:
             as_match = re.search(r'^(.+?)\s+AS\s+(\w+)$', expr, re.IGNORECASE)
             if as_match:
                 source_expr = as_match.group(1).strip()
-                alias = as_match.group(2)
+                alias = _intern(as_match.group(2))
             else:
                 source_expr = expr
                 alias = None
@@ -313,8 +464,8 @@ class EnhancedSqlParser:
             # Check for table.column format
             table_col_match = re.match(r'^(\w+)\.(\w+)$', source_expr)
             if table_col_match:
-                source_alias = table_col_match.group(1)
-                column_name = table_col_match.group(2)
+                source_alias = _intern(table_col_match.group(1))
+                column_name = _intern(table_col_match.group(2))
                 source_table = alias_to_table.get(source_alias)
             else:
                 # Simple column name
@@ -332,27 +483,7 @@ class EnhancedSqlParser:
     
     def _split_select_columns(self, select_clause: str) -> List[str]:
         """Split SELECT clause by commas, handling nested parentheses."""
-        columns = []
-        current_column = ""
-        paren_depth = 0
-        
-        for char in select_clause:
-            if char == '(':
-                paren_depth += 1
-            elif char == ')':
-                paren_depth -= 1
-            elif char == ',' and paren_depth == 0:
-                columns.append(current_column.strip())
-                current_column = ""
-                continue
-            
-            current_column += char
-        
-        # Add the last column
-        if current_column.strip():
-            columns.append(current_column.strip())
-        
-        return columns
+        return split_select_columns(select_clause)
     
     def _extract_where_clause(self, sql: str) -> Optional[str]:
         """Extract WHERE clause if present."""
@@ -1,15 +1,36 @@
 from ..ingestion_tool import IngestionTool
-from .ssis_parser import CanonicalSsisParser
-from typing import Generator, Tuple, List, Dict, Any
+from .ssis_parser import CanonicalSsisParser, _XML_PARSER
+from typing import Generator, Tuple, List, Dict, Any, Optional
 from ...models.graph import Node, Edge
 from ...models.canonical_types import NodeType
 import logging
+import multiprocessing
 from lxml import etree
 import re
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Parser owned by each worker process, built once by _init_worker
+_worker_parser: Optional[CanonicalSsisParser] = None
+
+
+def _init_worker(
+    connections_context: Dict[str, Dict[str, Any]],
+    parameters_context: Dict[str, Dict[str, Any]],
+) -> None:
+    """Pool initializer: build the worker's parser with the shared contexts."""
+    global _worker_parser
+    _worker_parser = CanonicalSsisParser(
+        connections_context=connections_context,
+        parameters_context=parameters_context,
+    )
+
+
+def _parse_package_file(file_path: str) -> List[Tuple[List[Node], List[Edge]]]:
+    """Worker entry point: parse one .dtsx package end to end."""
+    return list(_worker_parser.parse(file_path))
+
 
 class SsisLoader(IngestionTool):
     """
@@ -17,6 +38,11 @@ class SsisLoader(IngestionTool):
     It discovers and orchestrates the parsing of all relevant SSIS files.
     """
 
+    # Worker processes used to parse .dtsx packages; None means os.cpu_count()
+    # for projects of at least PARALLEL_PARSE_THRESHOLD bytes and in-process
+    # parsing below it. Set to 1 to always parse in-process.
+    max_workers: Optional[int] = None
+
     def ingest(self) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
         """
         Discovers and parses all .dtsx files in the project directory.
@@ -42,11 +68,6 @@ class SsisLoader(IngestionTool):
         if parameter_nodes:
             logger.info(f"Created {len(parameter_nodes)} project parameter node(s).")
 
-        # Create parser with connection and parameter contexts
-        parser = CanonicalSsisParser(
-            connections_context=connections_context,
-            parameters_context=parameters_context,
-        )
         ssis_files = self.discover_files("*.dtsx")
         if ssis_files:
             logger.info(f"Found {len(ssis_files)} SSIS package file(s).")
@@ -59,6 +80,21 @@ class SsisLoader(IngestionTool):
         if all_global_nodes:
             yield all_global_nodes, []
 
+        # Packages are independent of each other, so large projects are parsed
+        # in parallel
+        workers = self.parse_worker_count(ssis_files, self.max_workers)
+        if workers > 1:
+            yield from self._parse_package_files_parallel(
+                ssis_files, workers, connections_context, parameters_context
+            )
+            return
+
+        # Create parser with connection and parameter contexts
+        parser = CanonicalSsisParser(
+            connections_context=connections_context,
+            parameters_context=parameters_context,
+        )
+
         for file_path in ssis_files:
             try:
                 logger.info(f"Parsing file: {file_path}")
@@ -67,6 +103,33 @@ class SsisLoader(IngestionTool):
                 logger.error(f"Failed to parse {file_path}: {e}", exc_info=True)
                 continue
 
+    def _parse_package_files_parallel(
+        self,
+        ssis_files: List[Path],
+        workers: int,
+        connections_context: Dict[str, Dict[str, Any]],
+        parameters_context: Dict[str, Dict[str, Any]],
+    ) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
+        """
+        Parse .dtsx packages in a process pool.
+        
+        Each worker runs CanonicalSsisParser end to end and returns plain
+        (nodes, edges) batches, so no XML trees cross process boundaries. Results
+        are yielded in package file order.
+        """
+        file_paths = []
+        for file_path in ssis_files:
+            logger.info(f"Parsing file: {file_path}")
+            file_paths.append(str(file_path))
+
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(connections_context, parameters_context),
+        ) as pool:
+            for batches in pool.imap(_parse_package_file, file_paths):
+                yield from batches
+
     def _parse_connection_managers(self) -> Dict[str, Dict[str, Any]]:
         """
         Discovers and parses .conmgr files to extract detailed connection properties.
@@ -85,7 +148,7 @@ class SsisLoader(IngestionTool):
                 if content.startswith("\ufeff"):
                     content = content[1:]
 
-                root = etree.fromstring(content.encode("utf-8"))
+                root = etree.fromstring(content.encode("utf-8"), _XML_PARSER)
                 ns_map = {"DTS": "www.microsoft.com/SqlServer/Dts"}
 
                 # Extract connection details
@@ -282,7 +345,7 @@ class SsisLoader(IngestionTool):
                 if content.startswith("\ufeff"):
                     content = content[1:]
 
-                root = etree.fromstring(content.encode("utf-8"))
+                root = etree.fromstring(content.encode("utf-8"), _XML_PARSER)
                 ns_map = {"DTS": "www.microsoft.com/SqlServer/Dts"}
 
                 # Extract parameter details
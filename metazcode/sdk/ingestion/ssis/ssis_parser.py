@@ -4,6 +4,7 @@ from lxml import etree
 from typing import Dict, List, Tuple, Generator, Any, Optional
 import logging
 import json
+from functools import lru_cache
 
 from ...models.canonical_types import NodeType, EdgeType
 from ...models.graph import Node, Edge
@@ -13,6 +14,69 @@ from .sql_semantics import EnhancedSqlParser, SqlSemantics, create_join_edges_fr
 
 logger = logging.getLogger(__name__)
 
+# Shared by every parse: huge_tree lifts libxml2's size limits for packages with
+# large embedded scripts, and xml:id bookkeeping is never used
+_XML_PARSER = etree.XMLParser(huge_tree=True, collect_ids=False)
+
+# schema.table references reported as affected tables of SQL statements, in order
+_TABLE_REFERENCE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"FROM\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
+        r"JOIN\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
+        r"UPDATE\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
+        r"INSERT\s+INTO\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
+        r"DELETE\s+FROM\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
+    )
+)
+
+# schema.table references read or written by Execute SQL task statements
+_EXECUTE_SQL_TABLE_RE = re.compile(
+    r"(?:FROM|JOIN|UPDATE|INTO)\s+\[?(\w+)\]?\.\[?(\w+)\]?", re.IGNORECASE
+)
+
+# Variable and parameter references in SSIS expressions, used by
+# _parse_expression_dependencies: @[User::VariableName] and $Project::ParamName
+_EXPRESSION_VARIABLE_RE = re.compile(r"@\[(?:User::|System::)?([^\]]+)\]", re.IGNORECASE)
+_EXPRESSION_PARAMETER_RE = re.compile(r"\$(?:Project::|Package::)([^\s\)]+)", re.IGNORECASE)
+
+# Parameter GUIDs in Execute SQL parameter binding text
+_PARAMETER_GUID_RE = re.compile(r"\{([A-F0-9\-]+)\}", re.IGNORECASE)
+
+# Reference forms tried in order by _resolve_expression_with_parameters
+_PARAMETER_REFERENCE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\$Project::([\w\d_]+)",  # $Project::ParameterName
+        r"\$Package::([\w\d_]+)",  # $Package::ParameterName
+        r"@\[\$Project::([^\]]+)\]",  # @[$Project::ParameterName]
+        r"@\[\$Package::([^\]]+)\]",  # @[$Package::ParameterName]
+    )
+)
+_VARIABLE_REFERENCE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"@\[User::([^\]]+)\]",  # @[User::VariableName]
+        r"@\[System::([^\]]+)\]",  # @[System::VariableName]
+        r"@([\w\d_]+)",  # @VariableName (simple form)
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def _find_table_references(sql_statement: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Return the (schema, table) pairs matched by each table reference pattern in turn.
+    
+    The same statements recur across tasks and packages, so results are cached;
+    the tuple is immutable and callers build their own dicts from it.
+    """
+    return tuple(
+        reference
+        for pattern in _TABLE_REFERENCE_PATTERNS
+        for reference in pattern.findall(sql_statement)
+    )
+
 
 class CanonicalSsisParser:
     """
@@ -46,6 +110,15 @@ class CanonicalSsisParser:
         self.sql_parser = EnhancedSqlParser()
         self._pending_sql_semantics = None
 
+        # Operation and table nodes of the package being parsed, keyed by id,
+        # so sub-parsers can look them up without rescanning the node list.
+        self._node_index: Dict[str, Node] = {}
+
+    def _append_indexed_node(self, nodes: List[Node], node: Node) -> None:
+        """Appends a node and records it in the per-package node index."""
+        nodes.append(node)
+        self._node_index.setdefault(node.node_id, node)
+
     def _categorize_operation_subtype(self, native_type: str) -> str:
         """
         Categorizes SSIS operations into standardized subtypes based on their native type.
@@ -91,7 +164,7 @@ class CanonicalSsisParser:
             # Remove the BOM if it exists
             if content.startswith("\ufeff"):
                 content = content[1:]
-            root = etree.fromstring(content.encode("utf-8"))
+            root = etree.fromstring(content.encode("utf-8"), _XML_PARSER)
             yield from self._parse_package(root, file_path)
         except Exception as e:
             logger.error(
@@ -104,6 +177,7 @@ class CanonicalSsisParser:
     ) -> Generator[Tuple[List[Node], List[Edge]], None, None]:
         nodes: List[Node] = []
         edges: List[Edge] = []
+        self._node_index = {}
 
         # Parse connection managers first (local connections within .dtsx)
         connection_nodes, connection_id_map = self._parse_connection_managers(
@@ -189,7 +263,8 @@ class CanonicalSsisParser:
                 )
             }
             
-            nodes.append(
+            self._append_indexed_node(
+                nodes,
                 Node(
                     node_id=task_id,
                     node_type=NodeType.OPERATION,
@@ -246,7 +321,7 @@ class CanonicalSsisParser:
                     if (self._pending_sql_semantics and 
                         self._pending_sql_semantics.get("task_id") == task_id):
                         # Find the operation node and add SQL semantics
-                        operation_node = next((n for n in nodes if n.node_id == task_id), None)
+                        operation_node = self._node_index.get(task_id)
                         if operation_node:
                             operation_node.properties["sql_semantics"] = json.dumps(
                                 self._pending_sql_semantics["sql_semantics"]
@@ -443,7 +518,7 @@ class CanonicalSsisParser:
 
         # Add column lineage to the operation node if we have any column information
         if column_lineage["input_columns"] or column_lineage["output_columns"]:
-            operation_node = next((n for n in nodes if n.node_id == task_id), None)
+            operation_node = self._node_index.get(task_id)
             if operation_node:
                 if "column_lineage" not in operation_node.properties:
                     operation_node.properties["column_lineage"] = []
@@ -550,7 +625,7 @@ class CanonicalSsisParser:
         # Store transformations in the operation node properties
         if transformations:
             # Find or create the operation node for this component
-            operation_node = next((n for n in nodes if n.node_id == task_id), None)
+            operation_node = self._node_index.get(task_id)
             if operation_node:
                 if "transformations" not in operation_node.properties:
                     operation_node.properties["transformations"] = []
@@ -660,7 +735,7 @@ class CanonicalSsisParser:
         # Store conditions in the operation node properties
         if conditions:
             # Find the operation node for this component
-            operation_node = next((n for n in nodes if n.node_id == task_id), None)
+            operation_node = self._node_index.get(task_id)
             if operation_node:
                 if "conditions" not in operation_node.properties:
                     operation_node.properties["conditions"] = []
@@ -689,11 +764,8 @@ class CanonicalSsisParser:
         if not expression:
             return
 
-        import re
-
-        # Pattern for variable references: @[User::VariableName] or @[System::VariableName]
-        variable_pattern = r"@\[(?:User::|System::)?([^\]]+)\]"
-        variable_matches = re.findall(variable_pattern, expression, re.IGNORECASE)
+        # Variable references: @[User::VariableName] or @[System::VariableName]
+        variable_matches = _EXPRESSION_VARIABLE_RE.findall(expression)
 
         for var_name in variable_matches:
             # Look for variable in our mapping
@@ -708,9 +780,8 @@ class CanonicalSsisParser:
                 )
                 logger.debug(f"Found variable reference in expression: {var_name}")
 
-        # Pattern for parameter references: $Project::ParamName or $Package::ParamName
-        param_pattern = r"\$(?:Project::|Package::)([^\s\)]+)"
-        param_matches = re.findall(param_pattern, expression, re.IGNORECASE)
+        # Parameter references: $Project::ParamName or $Package::ParamName
+        param_matches = _EXPRESSION_PARAMETER_RE.findall(expression)
 
         for param_name in param_matches:
             param_id = f"parameter:{param_name}"
@@ -805,7 +876,7 @@ class CanonicalSsisParser:
                         table_id = f"table:{table_name_clean}"
                         
                         # Create table node if it doesn't exist
-                        if not any(n.node_id == table_id for n in nodes):
+                        if table_id not in self._node_index:
                             table_properties = {
                                 "technology": "SSIS",
                                 "table_name": table_name_clean,
@@ -835,7 +906,7 @@ class CanonicalSsisParser:
                                     table_properties["database"] = conn_info.get("database")
                                     table_properties["server"] = conn_info.get("server")
                             
-                            nodes.append(Node(
+                            self._append_indexed_node(nodes, Node(
                                 node_id=table_id,
                                 node_type=NodeType.DATA_ASSET,
                                 name=table_name_clean,
@@ -904,7 +975,7 @@ class CanonicalSsisParser:
         if table_name:
             table_name = table_name.strip("[]")
             table_id = f"table:{table_name}"
-            if not any(n.node_id == table_id for n in nodes):
+            if table_id not in self._node_index:
                 # Enhanced table properties with schema introspection and platform mapping
                 table_properties = {
                     "technology": "SSIS",
@@ -935,7 +1006,8 @@ class CanonicalSsisParser:
                         table_properties["database"] = conn_info.get("database")
                         table_properties["server"] = conn_info.get("server")
                 
-                nodes.append(
+                self._append_indexed_node(
+                    nodes,
                     Node(
                         node_id=table_id,
                         node_type=NodeType.TABLE,
@@ -979,10 +1051,7 @@ class CanonicalSsisParser:
             return
 
         # Extract parameter GUID from mapping text
-        import re
-
-        guid_pattern = r"\{([A-F0-9\-]+)\}"
-        matches = re.findall(guid_pattern, mapping_text, re.IGNORECASE)
+        matches = _PARAMETER_GUID_RE.findall(mapping_text)
 
         for guid in matches:
             if guid in param_var_id_map:
@@ -1052,7 +1121,7 @@ class CanonicalSsisParser:
         )
         if sql_statement:
             # Store the embedded SQL in the operation node properties
-            operation_node = next((n for n in nodes if n.node_id == task_id), None)
+            operation_node = self._node_index.get(task_id)
             if operation_node:
                 # Enhanced SQL transformation logic extraction
                 sql_info = {
@@ -1085,16 +1154,12 @@ class CanonicalSsisParser:
                     )
 
             # Extract table references from SQL for lineage
-            found_tables = re.findall(
-                r"(?:FROM|JOIN|UPDATE|INTO)\s+\[?(\w+)\]?\.\[?(\w+)\]?",
-                sql_statement,
-                re.IGNORECASE,
-            )
-            for schema, table in found_tables:
-                table_name = f"{schema}.{table}"
+            for table_match in _EXECUTE_SQL_TABLE_RE.finditer(sql_statement):
+                table_name = f"{table_match[1]}.{table_match[2]}"
                 table_id = f"table:{table_name}"
-                if not any(n.node_id == table_id for n in nodes):
-                    nodes.append(
+                if table_id not in self._node_index:
+                    self._append_indexed_node(
+                        nodes,
                         Node(
                             node_id=table_id,
                             node_type=NodeType.TABLE,
@@ -1152,26 +1217,14 @@ class CanonicalSsisParser:
 
     def _extract_table_references(self, sql_statement: str) -> List[Dict[str, str]]:
         """Extract table references from SQL statement."""
-        tables = []
-        # Enhanced regex to capture various SQL patterns
-        patterns = [
-            r"FROM\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
-            r"JOIN\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
-            r"UPDATE\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
-            r"INSERT\s+INTO\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?",
-            r"DELETE\s+FROM\s+\[?([\w\d_]+)\]?\.\[?([\w\d_]+)\]?"
+        return [
+            {
+                "schema": schema,
+                "table": table,
+                "full_name": f"{schema}.{table}"
+            }
+            for schema, table in _find_table_references(sql_statement)
         ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, sql_statement, re.IGNORECASE)
-            for schema, table in matches:
-                tables.append({
-                    "schema": schema,
-                    "table": table,
-                    "full_name": f"{schema}.{table}"
-                })
-        
-        return tables
 
     def _parse_oledb_command_component(
         self,
@@ -1198,7 +1251,7 @@ class CanonicalSsisParser:
                 sql_command = sql_command_prop.text.strip()
                 
                 # Find the operation node and add SQL transformation logic
-                operation_node = next((n for n in nodes if n.node_id == task_id), None)
+                operation_node = self._node_index.get(task_id)
                 if operation_node:
                     # Extract connection information
                     conn_ref = None
@@ -1256,11 +1309,13 @@ class CanonicalSsisParser:
         
         if script_task_data_xml is None:
             # Try scanning all children for script-related elements
-            for child in object_data_xml:
-                child_tag = child.tag.lower()
-                if "scripttaskdata" in child_tag or "scriptproject" in child_tag:
-                    script_task_data_xml = child
-                    break
+            script_task_data_xml = next(
+                (
+                    child for child in object_data_xml
+                    if "scripttaskdata" in child.tag.lower() or "scriptproject" in child.tag.lower()
+                ),
+                None,
+            )
         
         if script_task_data_xml is None:
             logger.debug(f"No ScriptTaskData or ScriptProject found in Script Task {task_id}")
@@ -1270,7 +1325,7 @@ class CanonicalSsisParser:
 
         # Extract script information
         script_info = {
-            "task_name": task_id.split(":")[-1],
+            "task_name": task_id.rpartition(":")[2],
             "script_language": "VB.NET",  # Default, will be updated if found
             "script_code": "",
             "referenced_variables": [],
@@ -1376,7 +1431,7 @@ class CanonicalSsisParser:
             )
 
         # Store script information in the operation node properties
-        operation_node = next((n for n in nodes if n.node_id == task_id), None)
+        operation_node = self._node_index.get(task_id)
         if operation_node:
             operation_node.properties["custom_script"] = script_info
             
@@ -1446,7 +1501,7 @@ class CanonicalSsisParser:
             error_config["input_error_configs"] or 
             error_config["output_error_configs"]):
             
-            operation_node = next((n for n in nodes if n.node_id == task_id), None)
+            operation_node = self._node_index.get(task_id)
             if operation_node:
                 operation_node.properties["error_handling"] = error_config
                 logger.debug(
@@ -1521,7 +1576,7 @@ class CanonicalSsisParser:
         Handles formats like "Package\TaskName" or just "TaskName"
         """
         if "\\" in task_ref:
-            return task_ref.split("\\")[-1]
+            return task_ref.rpartition("\\")[2]
         return task_ref
 
     def _parse_package_parameters(
@@ -1823,7 +1878,7 @@ class CanonicalSsisParser:
         # Store lookup info in the operation node properties
         if lookup_info["join_conditions"] or lookup_info["output_columns"]:
             # Find the operation node for this component
-            operation_node = next((n for n in nodes if n.node_id == task_id), None)
+            operation_node = self._node_index.get(task_id)
             if operation_node:
                 if "lookups" not in operation_node.properties:
                     operation_node.properties["lookups"] = []
@@ -1939,10 +1994,13 @@ class CanonicalSsisParser:
                         expression = None
                         properties_xml = output_col_xml.find("properties")
                         if properties_xml is not None:
-                            for prop_xml in properties_xml.findall("property"):
-                                if prop_xml.get("name") == "Expression":
-                                    expression = prop_xml.text
-                                    break
+                            expression = next(
+                                (
+                                    prop_xml.text for prop_xml in properties_xml.iterfind("property")
+                                    if prop_xml.get("name") == "Expression"
+                                ),
+                                None,
+                            )
 
                         # Enrich output column with type mapping
                         type_properties = {}
@@ -1997,8 +2055,6 @@ class CanonicalSsisParser:
                 "is_parameterized": False
             }
             
-        import re
-        
         result = {
             "raw_expression": expression,
             "uses_parameters": [],
@@ -2008,15 +2064,8 @@ class CanonicalSsisParser:
         }
         
         # Enhanced parameter pattern matching
-        param_patterns = [
-            r"\$Project::([\w\d_]+)",  # $Project::ParameterName
-            r"\$Package::([\w\d_]+)",  # $Package::ParameterName
-            r"@\[\$Project::([^\]]+)\]",  # @[$Project::ParameterName]
-            r"@\[\$Package::([^\]]+)\]"   # @[$Package::ParameterName]
-        ]
-        
-        for pattern in param_patterns:
-            matches = re.findall(pattern, expression, re.IGNORECASE)
+        for pattern in _PARAMETER_REFERENCE_PATTERNS:
+            matches = pattern.findall(expression)
             for match in matches:
                 param_name = match.strip()
                 if param_name not in result["uses_parameters"]:
@@ -2041,14 +2090,8 @@ class CanonicalSsisParser:
                                 )
         
         # Enhanced variable pattern matching
-        variable_patterns = [
-            r"@\[User::([^\]]+)\]",     # @[User::VariableName]
-            r"@\[System::([^\]]+)\]",   # @[System::VariableName]
-            r"@([\w\d_]+)"              # @VariableName (simple form)
-        ]
-        
-        for pattern in variable_patterns:
-            matches = re.findall(pattern, expression, re.IGNORECASE)
+        for pattern in _VARIABLE_REFERENCE_PATTERNS:
+            matches = pattern.findall(expression)
             for match in matches:
                 var_name = match.strip()
                 if var_name not in result["uses_variables"]:
@@ -2490,52 +2533,6 @@ class CanonicalSsisParser:
         # Default to SQL Server if uncertain
         return TargetPlatform.SQL_SERVER
     
-    def _extract_tables_from_sql(self, sql_text: str) -> List[str]:
-        """
-        Extract table names from SQL commands in SSIS components.
-        
-        This replaces the broken regex that only handled schema.table format.
-        Now handles:
-        - Simple tables: Products, Categories  
-        - Bracketed tables: [Products], [Categories]
-        - Schema-qualified: dbo.Products, [dbo].[Products]
-        - Table aliases: Products AS p, Categories c
-        - All JOIN types: INNER JOIN, LEFT JOIN, etc.
-        
-        Args:
-            sql_text: SQL command text from SSIS component
-            
-        Returns:
-            List of table names found in the SQL
-        """
-        if not sql_text or not isinstance(sql_text, str):
-            return []
-        
-        tables = set()
-        
-        # Pattern 1: Handle [schema].[table] format
-        bracketed_schema_pattern = r'(?:FROM|JOIN)\s+\[([^\]]+)\]\.\[([^\]]+)\](?:\s+(?:AS\s+)?\w+)?'
-        matches = re.findall(bracketed_schema_pattern, sql_text, re.IGNORECASE)
-        for schema, table in matches:
-            tables.add(f"{schema}.{table}")
-        
-        # Pattern 2: Handle schema.table format (no brackets)
-        plain_schema_pattern = r'(?:FROM|JOIN)\s+([^\s\[\]\.]+)\.([^\s\[\]\.]+)(?:\s+(?:AS\s+)?\w+)?'
-        matches = re.findall(plain_schema_pattern, sql_text, re.IGNORECASE)
-        for schema, table in matches:
-            if not any(existing == f"{schema}.{table}" for existing in tables):
-                tables.add(f"{schema}.{table}")
-        
-        # Pattern 3: Handle simple table names (only if not already captured above)
-        simple_pattern = r'(?:FROM|JOIN)\s+\[?([^\s\[\]\.]+)\]?(?:\s+(?:AS\s+)?\w+)?'
-        matches = re.findall(simple_pattern, sql_text, re.IGNORECASE)
-        for table in matches:
-            # Only add if this table isn't already part of a schema.table entry
-            if not any(existing.endswith(f".{table}") for existing in tables):
-                tables.add(table)
-        
-        return sorted(list(tables))
-    
     def _get_platform_type_rules(self, platform: TargetPlatform) -> Dict[str, str]:
         """
         Get simplified type mapping rules for a platform.
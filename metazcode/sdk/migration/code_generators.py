@@ -6,6 +6,7 @@ This module provides code generators that convert SSIS graph metadata with SQL s
 into platform-specific code for Spark, dbt, Azure Data Factory, and Python/Pandas.
 """
 
+import re
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -15,6 +16,9 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Simple equality join condition: "p.CategoryID = c.CategoryID"
+_EQUI_JOIN_RE = re.compile(r'(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)')
+
 class TargetPlatform(str, Enum):
     """Supported target platforms for migration."""
     SPARK = "spark"
@@ -93,7 +97,6 @@ class CodeGenerator(ABC):
         
         if convention == "snake_case":
             # Convert to snake_case
-            import re
             name = re.sub('([A-Z]+)', r'_\1', name).lower()
             return name.strip('_')
         elif convention == "camel_case":
@@ -162,14 +165,13 @@ class SparkCodeGenerator(CodeGenerator):
                 
                 if i == 0:
                     code_lines.append(f"result_df = df_{left_table.lower()}.alias('{left_alias}') \\")
-                    code_lines.append(f"    .join(df_{right_table.lower()}.alias('{right_alias}'), \\")
-                    code_lines.append(f"          {spark_condition}, \\")
-                    code_lines.append(f"          '{join_type}')")
                 else:
-                    code_lines.append(f"result_df = result_df \\")
-                    code_lines.append(f"    .join(df_{right_table.lower()}.alias('{right_alias}'), \\")
-                    code_lines.append(f"          {spark_condition}, \\")
-                    code_lines.append(f"          '{join_type}')")
+                    code_lines.append("result_df = result_df \\")
+                code_lines.extend((
+                    f"    .join(df_{right_table.lower()}.alias('{right_alias}'), \\",
+                    f"          {spark_condition}, \\",
+                    f"          '{join_type}')",
+                ))
         
         else:
             # Single table case
@@ -182,32 +184,16 @@ class SparkCodeGenerator(CodeGenerator):
         # Generate SELECT operations
         if columns:
             code_lines.append("# Select columns")
-            select_expressions = []
-            
-            for column in columns:
-                expr = column.get('expression', '')
-                alias = column.get('alias')
-                
-                if alias:
-                    # Handle aliased columns
-                    if '.' in expr:  # table.column format
-                        spark_expr = f"col('{expr}')"
-                    else:
-                        spark_expr = f"col('{expr}')"
-                    select_expressions.append(f"{spark_expr}.alias('{alias}')")
-                else:
-                    # Simple column reference
-                    if '.' in expr:
-                        select_expressions.append(f"col('{expr}')")
-                    else:
-                        select_expressions.append(f"col('{expr}')")
+            # Aliased and plain columns (table.column or bare) share the col() form
+            select_expressions = [
+                f"col('{column.get('expression', '')}')"
+                + (f".alias('{column['alias']}')" if column.get('alias') else "")
+                for column in columns
+            ]
             
-            if select_expressions:
-                code_lines.append("result_df = result_df.select(")
-                for i, expr in enumerate(select_expressions):
-                    comma = "," if i < len(select_expressions) - 1 else ""
-                    code_lines.append(f"    {expr}{comma}")
-                code_lines.append(")")
+            code_lines.append("result_df = result_df.select(")
+            code_lines.append(",\n".join(f"    {expr}" for expr in select_expressions))
+            code_lines.append(")")
         
         code_lines.append("")
         code_lines.append("# Show results")
@@ -232,10 +218,8 @@ class SparkCodeGenerator(CodeGenerator):
         """Convert SQL JOIN condition to Spark DataFrame condition."""
         # Simple conversion for basic equality joins
         # Example: "p.CategoryID = c.CategoryID" -> "col('p.CategoryID') == col('c.CategoryID')"
-        import re
-        
         # Handle simple equality conditions
-        match = re.match(r'(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)', condition.strip())
+        match = _EQUI_JOIN_RE.match(condition.strip())
         if match:
             left_table, left_col, right_table, right_col = match.groups()
             return f"col('{left_table}.{left_col}') == col('{right_table}.{right_col}')"
@@ -268,15 +252,11 @@ class DbtCodeGenerator(CodeGenerator):
         # Generate SELECT clause
         if columns:
             code_lines.append("SELECT")
-            for i, column in enumerate(columns):
-                expr = column.get('expression', '')
-                alias = column.get('alias')
-                comma = "," if i < len(columns) - 1 else ""
-                
-                if alias:
-                    code_lines.append(f"    {expr} AS {alias}{comma}")
-                else:
-                    code_lines.append(f"    {expr}{comma}")
+            code_lines.append(",\n".join(
+                f"    {column.get('expression', '')} AS {column['alias']}"
+                if column.get('alias') else f"    {column.get('expression', '')}"
+                for column in columns
+            ))
         else:
             code_lines.append("SELECT *")
         
@@ -375,24 +355,20 @@ class PandasCodeGenerator(CodeGenerator):
                 left_key, right_key = self._parse_join_keys(condition)
                 join_type = self._convert_join_type_to_pandas(join.get('join_type', 'INNER JOIN'))
                 
-                if i == 0:
-                    code_lines.append(f"result_df = pd.merge(")
-                    code_lines.append(f"    df_{left_table.lower()},")
-                    code_lines.append(f"    df_{right_table.lower()},")
-                    code_lines.append(f"    left_on='{left_key}',")
-                    code_lines.append(f"    right_on='{right_key}',")
-                    code_lines.append(f"    how='{join_type}',")
-                    code_lines.append(f"    suffixes=('_left', '_right')")
-                    code_lines.append(")")
-                else:
-                    code_lines.append(f"result_df = pd.merge(")
-                    code_lines.append(f"    result_df,")
-                    code_lines.append(f"    df_{right_table.lower()},")
-                    code_lines.append(f"    left_on='{left_key}',")
-                    code_lines.append(f"    right_on='{right_key}',")
-                    code_lines.append(f"    how='{join_type}',")
-                    code_lines.append(f"    suffixes=('', '_right')")
-                    code_lines.append(")")
+                left_df, suffixes = (
+                    (f"df_{left_table.lower()}", "('_left', '_right')") if i == 0
+                    else ("result_df", "('', '_right')")
+                )
+                code_lines.extend((
+                    "result_df = pd.merge(",
+                    f"    {left_df},",
+                    f"    df_{right_table.lower()},",
+                    f"    left_on='{left_key}',",
+                    f"    right_on='{right_key}',",
+                    f"    how='{join_type}',",
+                    f"    suffixes={suffixes}",
+                    ")",
+                ))
         else:
             # Single table case
             if tables:
@@ -444,10 +420,8 @@ class PandasCodeGenerator(CodeGenerator):
     
     def _parse_join_keys(self, condition: str) -> Tuple[str, str]:
         """Parse join condition to extract left and right keys."""
-        import re
-        
         # Handle simple equality conditions: "table1.col1 = table2.col2"
-        match = re.match(r'(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)', condition.strip())
+        match = _EQUI_JOIN_RE.match(condition.strip())
         if match:
             left_table, left_col, right_table, right_col = match.groups()
             return left_col, right_col
@@ -6,9 +6,278 @@ for both nodes and edges in the knowledge graph, ensuring every element can be t
 back to its original source file and context.
 """
 
-from typing import Dict, Any, Optional
+import hashlib
+import json
+import math
+import mmap
+import multiprocessing
+import os
+import sys
+import tempfile
+from collections import Counter
+from functools import lru_cache
+from typing import AbstractSet, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Properties a node or edge must carry to be traceable back to its source
+_NODE_TRACEABILITY_KEYS = frozenset({"source_file_path", "source_file_type", "technology"})
+_EDGE_TRACEABILITY_KEYS = frozenset(
+    {"source_file_path", "derivation_method", "confidence_level", "technology"}
+)
+_VALID_DERIVATION_METHODS = ("xml_metadata", "sql_parsing", "data_flow_analysis", "inference")
+
+# Loaded graphs with fewer elements than this are validated in-process; below
+# it, starting worker processes costs more than the checks themselves
+PARALLEL_VALIDATION_THRESHOLD = 10_000
+
+# Properties tallied per element by TraceabilityValidator.validate_graph_file
+_NODE_COUNTED_KEYS = _NODE_TRACEABILITY_KEYS | {"xml_path"}
+_EDGE_COUNTED_KEYS = _EDGE_TRACEABILITY_KEYS | {"context_info"}
+
+# Bump when the shape of validation results or the checks themselves change.
+# Cached results live in a directory named after this version and the rule
+# sets above, so results computed under other rules are never reused.
+_VALIDATION_CACHE_VERSION = 1
+_VALIDATION_CACHE_KEY = "v{}-{}".format(
+    _VALIDATION_CACHE_VERSION,
+    hashlib.sha256(
+        repr((
+            sorted(_NODE_TRACEABILITY_KEYS),
+            sorted(_EDGE_TRACEABILITY_KEYS),
+            _VALID_DERIVATION_METHODS,
+            sorted(_NODE_COUNTED_KEYS),
+            sorted(_EDGE_COUNTED_KEYS),
+        )).encode("utf-8")
+    ).hexdigest()[:12],
+)
+
+
+@lru_cache(maxsize=1024)
+def _canonical_source_path(source_file_path: str) -> str:
+    """
+    Resolve a source file path once and share a single string object for it.
+    
+    Every node and edge parsed from a file carries that file's path, so the
+    resolved path is interned instead of being rebuilt for each element.
+    """
+    return sys.intern(str(Path(source_file_path).resolve()))
+
+
+def _node_is_traceable(properties: Dict[str, Any], present: AbstractSet[str]) -> bool:
+    """
+    True when every validate_node_traceability check passes.
+    
+    present is the set of property names already intersected with _NODE_COUNTED_KEYS.
+    """
+    return _NODE_TRACEABILITY_KEYS <= present and bool(properties["source_file_path"])
+
+
+def _edge_is_traceable(properties: Dict[str, Any], present: AbstractSet[str]) -> bool:
+    """
+    True when every validate_edge_traceability check passes.
+    
+    present is the set of property names already intersected with _EDGE_COUNTED_KEYS.
+    """
+    return (
+        _EDGE_TRACEABILITY_KEYS <= present
+        and properties["derivation_method"] in _VALID_DERIVATION_METHODS
+    )
+
+
+def _read_json(path: Any) -> Any:
+    """Read a JSON file, decoding with orjson when it is installed."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and some file systems cannot be mapped
+                return orjson.loads(f.read())
+            # Parse the mapped pages directly instead of copying the file into bytes
+            with mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _stream_graph_section(graph_file: str, section: str) -> Iterator[Dict[str, Any]]:
+    """Yield the elements of one top-level list of a graph JSON file as they are parsed."""
+    with open(graph_file, "rb") as f:
+        yield from ijson.items(f, f"{section}.item", use_float=True)
+
+
+def _load_graph_sections(
+    graph_file: str, stream: bool = True
+) -> Tuple[Iterable[Dict[str, Any]], Iterable[Dict[str, Any]]]:
+    """
+    Return the nodes and links of a node-link graph JSON file.
+    
+    With stream set and ijson installed both are lazy streams, so only the
+    element being checked is held in memory; otherwise the whole file is
+    loaded once, through orjson when it is available.
+    """
+    if stream and ijson is not None:
+        return (
+            _stream_graph_section(graph_file, "nodes"),
+            _stream_graph_section(graph_file, "links"),
+        )
+    graph_data = _read_json(graph_file)
+    return graph_data.get("nodes", []), graph_data.get("links", [])
+
+
+def _validate_graph_elements(
+    nodes: Iterable[Dict[str, Any]], edges: Iterable[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run the traceability checks and property tallies over node and edge dicts."""
+    # One pass per element list: the same intersection feeds the property
+    # tallies and the traceability check. Totals come from enumerate and
+    # traceable counts from the failure lists, so the loop bodies keep no
+    # counters of their own.
+    node_counts: Counter = Counter()
+    untraceable_nodes: List[Any] = []
+    total_nodes = 0
+    for total_nodes, node in enumerate(nodes, 1):
+        properties = node.get("properties", {})
+        present = properties.keys() & _NODE_COUNTED_KEYS
+        node_counts.update(present)
+        if not _node_is_traceable(properties, present):
+            untraceable_nodes.append(node.get("id"))
+    
+    edge_counts: Counter = Counter()
+    untraceable_edges: List[str] = []
+    total_edges = 0
+    for total_edges, edge in enumerate(edges, 1):
+        properties = edge.get("properties", {})
+        present = properties.keys() & _EDGE_COUNTED_KEYS
+        edge_counts.update(present)
+        if not _edge_is_traceable(properties, present):
+            untraceable_edges.append(f"{edge.get('source')} -> {edge.get('target')}")
+    
+    return {
+        "total_nodes": total_nodes,
+        "traceable_nodes": total_nodes - len(untraceable_nodes),
+        "untraceable_nodes": untraceable_nodes,
+        "total_edges": total_edges,
+        "traceable_edges": total_edges - len(untraceable_edges),
+        "untraceable_edges": untraceable_edges,
+        "node_property_counts": {
+            key: node_counts[key] for key in sorted(_NODE_COUNTED_KEYS)
+        },
+        "edge_property_counts": {
+            key: edge_counts[key] for key in sorted(_EDGE_COUNTED_KEYS)
+        },
+    }
+
+
+# Loaded nodes and links, set before the pool forks so workers read them
+# through copy-on-write pages instead of receiving pickled chunks
+_worker_elements: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]] = ([], [])
+
+
+def _validate_element_range(task: Tuple[str, int, int]) -> Dict[str, Any]:
+    """Pool worker: validate one slice of the inherited nodes or links."""
+    section, start, stop = task
+    nodes, edges = _worker_elements
+    if section == "nodes":
+        return _validate_graph_elements(nodes[start:stop], ())
+    return _validate_graph_elements((), edges[start:stop])
+
+
+def _merge_validation_results(parts: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-slice results, in slice order, into one validation result."""
+    merged = _validate_graph_elements((), ())
+    for part in parts:
+        for key in ("total_nodes", "traceable_nodes", "total_edges", "traceable_edges"):
+            merged[key] += part[key]
+        merged["untraceable_nodes"].extend(part["untraceable_nodes"])
+        merged["untraceable_edges"].extend(part["untraceable_edges"])
+        for key in ("node_property_counts", "edge_property_counts"):
+            for name, count in part[key].items():
+                merged[key][name] += count
+    return merged
+
+
+def _validate_graph_elements_parallel(
+    nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]], processes: int
+) -> Dict[str, Any]:
+    """Validate loaded nodes and links in slices across a forked process pool."""
+    global _worker_elements
+    tasks = []
+    for section, elements in (("nodes", nodes), ("links", edges)):
+        chunk_size = max(1, math.ceil(len(elements) / processes))
+        tasks.extend(
+            (section, start, min(start + chunk_size, len(elements)))
+            for start in range(0, len(elements), chunk_size)
+        )
+    
+    _worker_elements = (nodes, edges)
+    try:
+        with multiprocessing.get_context("fork").Pool(processes=processes) as pool:
+            # imap keeps slice order, so failure lists match the serial order
+            return _merge_validation_results(pool.imap(_validate_element_range, tasks))
+    finally:
+        _worker_elements = ([], [])
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Write JSON to path through a temporary file in the same directory.
+    
+    os.replace swaps the finished file in, so concurrent readers see either
+    the previous contents or the complete new ones. Write errors are ignored;
+    callers only use this for caches.
+    """
+    temp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            temp_path = f.name
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def _validation_cache_file(graph_file: str) -> Path:
+    """
+    Return where the validation result for a graph file is cached.
+    
+    Results live in the user cache directory ($XDG_CACHE_HOME, or ~/.cache)
+    under mzcode/traceability/<rule version>/, one file per resolved graph
+    path, so revalidating changed contents replaces the previous result
+    instead of adding another.
+    """
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    resolved = str(Path(graph_file).resolve())
+    name = hashlib.sha256(resolved.encode("utf-8")).hexdigest()
+    return cache_root / "mzcode" / "traceability" / _VALIDATION_CACHE_KEY / f"{name}.json"
+
+
+def _graph_file_digest(graph_file: str) -> str:
+    """SHA-256 of a graph file's bytes, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(graph_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class SourceContext:
     """Standardized source context for nodes and edges"""
@@ -37,7 +306,7 @@ class SourceContext:
             Dictionary with standardized traceability properties
         """
         context = {
-            "source_file_path": str(Path(source_file_path).resolve()),
+            "source_file_path": _canonical_source_path(source_file_path),
             "source_file_type": source_file_type,
             "technology": technology
         }
@@ -47,7 +316,7 @@ class SourceContext:
         if line_number:
             context["line_number"] = line_number
         if parent_package:
-            context["parent_package"] = parent_package
+            context["parent_package"] = sys.intern(parent_package)
             
         return context
 
@@ -76,7 +345,7 @@ class SourceContext:
             Dictionary with standardized traceability properties
         """
         context = {
-            "source_file_path": str(Path(source_file_path).resolve()),
+            "source_file_path": _canonical_source_path(source_file_path),
             "derivation_method": derivation_method,
             "confidence_level": confidence_level,
             "technology": technology
@@ -197,15 +466,13 @@ class TraceabilityValidator:
             Dictionary with validation results
         """
         properties = node_dict.get("properties", {})
+        present = properties.keys() & _NODE_TRACEABILITY_KEYS
         
         return {
-            "has_source_file_path": "source_file_path" in properties,
-            "has_source_file_type": "source_file_type" in properties,
-            "has_technology": "technology" in properties,
-            "is_valid_file_path": (
-                "source_file_path" in properties and 
-                bool(properties.get("source_file_path"))
-            )
+            "has_source_file_path": "source_file_path" in present,
+            "has_source_file_type": "source_file_type" in present,
+            "has_technology": "technology" in present,
+            "is_valid_file_path": bool(properties.get("source_file_path"))
         }
     
     @staticmethod
@@ -220,16 +487,90 @@ class TraceabilityValidator:
             Dictionary with validation results
         """
         properties = edge_dict.get("properties", {})
+        present = properties.keys() & _EDGE_TRACEABILITY_KEYS
         
         return {
-            "has_source_file_path": "source_file_path" in properties,
-            "has_derivation_method": "derivation_method" in properties,
-            "has_confidence_level": "confidence_level" in properties,
-            "has_technology": "technology" in properties,
+            "has_source_file_path": "source_file_path" in present,
+            "has_derivation_method": "derivation_method" in present,
+            "has_confidence_level": "confidence_level" in present,
+            "has_technology": "technology" in present,
             "is_valid_derivation": (
-                "derivation_method" in properties and 
-                properties.get("derivation_method") in [
-                    "xml_metadata", "sql_parsing", "data_flow_analysis", "inference"
-                ]
+                "derivation_method" in present and 
+                properties["derivation_method"] in _VALID_DERIVATION_METHODS
             )
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def validate_graph_file(
+        graph_file: str, use_cache: bool = True, max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate traceability for every node and edge of an exported graph file.
+        
+        Args:
+            graph_file: Path to a node-link graph JSON file, such as the
+                enhanced graph written by the full analysis command
+            use_cache: Reuse the stored result when the file's size and mtime,
+                or failing that its contents, match the last validation
+            max_workers: Processes for validating graphs with at least
+                PARALLEL_VALIDATION_THRESHOLD elements. Passing it loads the
+                whole graph so the pool can run. By default the graph is
+                streamed and validated in-process when ijson is installed,
+                and loaded and validated across all CPUs otherwise.
+            
+        Returns:
+            Dictionary with node and edge totals, fully traceable counts, the
+            elements missing traceability information and per-property tallies
+        """
+        cache_file = None
+        digest = None
+        if use_cache:
+            # Validation depends only on the file contents and the rules; the
+            # stored size and mtime let an untouched file skip even hashing
+            cache_file = _validation_cache_file(graph_file)
+            stat = os.stat(graph_file)
+            try:
+                entry = _read_json(cache_file)
+            except (ValueError, OSError):
+                # Missing, unreadable or corrupt cache files are revalidated
+                entry = None
+            if isinstance(entry, dict) and isinstance(entry.get("result"), dict):
+                if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                    return entry["result"]
+                digest = _graph_file_digest(graph_file)
+                if entry.get("digest") == digest:
+                    # Same contents under a new mtime: record the new stat
+                    entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                    _write_json_atomic(cache_file, entry)
+                    return entry["result"]
+            if digest is None:
+                digest = _graph_file_digest(graph_file)
+        
+        # Streamed elements cannot be sliced across processes, so an explicit
+        # worker count loads the graph whole
+        nodes, edges = _load_graph_sections(graph_file, stream=max_workers is None)
+        processes = max_workers or os.cpu_count() or 1
+        if (
+            processes > 1
+            and isinstance(nodes, list)
+            and isinstance(edges, list)
+            and len(nodes) + len(edges) >= PARALLEL_VALIDATION_THRESHOLD
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            result = _validate_graph_elements_parallel(nodes, edges, processes)
+        else:
+            result = _validate_graph_elements(nodes, edges)
+        
+        if cache_file is not None:
+            _write_json_atomic(
+                cache_file,
+                {
+                    "graph_file": str(Path(graph_file).resolve()),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "digest": digest,
+                    "result": result,
+                },
+            )
+        
+        return result
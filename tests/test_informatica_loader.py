@@ -0,0 +1,72 @@
+"""
+Tests for InformaticaLoader workflow parsing.
+"""
+
+from metazcode.sdk.ingestion.informatica.informatica_loader import InformaticaLoader
+
+WORKFLOW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<POWERMART>
+<REPOSITORY NAME="REPO">
+<FOLDER NAME="WF">
+    <WORKFLOW NAME="wf_{name}">
+        <SESSION NAME="s_m_{name}" MAPPINGNAME="m_{name}"/>
+        <TASKINSTANCE NAME="s_m_{name}" TASKNAME="s_m_{name}" TASKTYPE="Session"/>
+    </WORKFLOW>
+</FOLDER>
+</REPOSITORY>
+</POWERMART>
+"""
+
+MAPPING_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<POWERMART>
+<REPOSITORY NAME="REPO">
+<FOLDER NAME="ETL">
+    <SOURCE NAME="SRC_{name}" DATABASETYPE="Oracle">
+        <SOURCEFIELD NAME="ID" DATATYPE="number"/>
+    </SOURCE>
+    <TARGET NAME="TGT_{name}" DATABASETYPE="Oracle">
+        <TARGETFIELD NAME="ID" DATATYPE="number"/>
+    </TARGET>
+    <MAPPING NAME="m_{name}">
+        <TRANSFORMATION NAME="EXPTRANS" TYPE="Expression" REUSABLE="NO">
+            <TRANSFORMFIELD NAME="ID" EXPRESSION="ID"/>
+        </TRANSFORMATION>
+        <INSTANCE NAME="SRC_{name}" TRANSFORMATION_NAME="SRC_{name}" TRANSFORMATION_TYPE="Source Definition" TYPE="SOURCE"/>
+        <INSTANCE NAME="EXPTRANS" TRANSFORMATION_NAME="EXPTRANS" TRANSFORMATION_TYPE="Expression" TYPE="TRANSFORMATION"/>
+        <INSTANCE NAME="TGT_{name}" TRANSFORMATION_NAME="TGT_{name}" TRANSFORMATION_TYPE="Target Definition" TYPE="TARGET"/>
+        <CONNECTOR FROMINSTANCE="SRC_{name}" FROMFIELD="ID" TOINSTANCE="EXPTRANS" TOFIELD="ID"/>
+        <CONNECTOR FROMINSTANCE="EXPTRANS" FROMFIELD="ID" TOINSTANCE="TGT_{name}" TOFIELD="ID"/>
+    </MAPPING>
+</FOLDER>
+</REPOSITORY>
+</POWERMART>
+"""
+
+
+def _write_project(root):
+    # One workflow per directory so each finds its own mapping file
+    for name in ("orders", "customers", "products"):
+        directory = root / name
+        directory.mkdir()
+        (directory / f"WorkFlow_{name}.XML").write_text(WORKFLOW_XML.format(name=name))
+        (directory / f"Mapping_{name}.XML").write_text(MAPPING_XML.format(name=name))
+
+
+def _ingest(root, max_workers):
+    loader = InformaticaLoader(str(root))
+    loader.max_workers = max_workers
+    return list(loader.ingest())
+
+
+def test_small_project_is_parsed_in_process(tmp_path):
+    _write_project(tmp_path)
+    loader = InformaticaLoader(str(tmp_path))
+    assert loader.parse_worker_count(loader._discover_workflow_files()) == 1
+
+
+def test_pool_output_matches_serial_output(tmp_path):
+    _write_project(tmp_path)
+    serial = _ingest(tmp_path, 1)
+    pooled = _ingest(tmp_path, 2)
+    assert len(serial) == 3
+    assert pooled == serial
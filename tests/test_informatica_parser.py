@@ -0,0 +1,97 @@
+"""
+Tests for CanonicalInformaticaParser mapping-file parsing.
+"""
+
+from metazcode.sdk.ingestion.informatica import CanonicalInformaticaParser
+
+WORKFLOW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<POWERMART><REPOSITORY NAME="REPO"><FOLDER NAME="WF"></FOLDER></REPOSITORY></POWERMART>
+"""
+
+MAPPING_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<POWERMART>
+<REPOSITORY NAME="REPO">
+<FOLDER NAME="ETL">
+    <MAPPING NAME="m_one">
+        <TRANSFORMATION NAME="EXPTRANS" TYPE="Expression" REUSABLE="NO">
+            <TRANSFORMFIELD NAME="OUT_A" EXPRESSION="UPPER(A)"/>
+        </TRANSFORMATION>
+        <INSTANCE NAME="EXPTRANS" INSTANCENAME="EXPTRANS" TRANSFORMATION_NAME="EXPTRANS" TRANSFORMATION_TYPE="Expression" TYPE="TRANSFORMATION"/>
+        <INSTANCE NAME="LKP_R" INSTANCENAME="LKP_R" TRANSFORMATION_NAME="LKP_R" TRANSFORMATION_TYPE="Lookup Procedure" TYPE="TRANSFORMATION"/>
+    </MAPPING>
+    <MAPPING NAME="m_two">
+        <TRANSFORMATION NAME="EXPTRANS" TYPE="Expression" REUSABLE="NO">
+            <TRANSFORMFIELD NAME="OUT_B" EXPRESSION="LOWER(B)"/>
+        </TRANSFORMATION>
+        <INSTANCE NAME="EXPTRANS" INSTANCENAME="EXPTRANS" TRANSFORMATION_NAME="EXPTRANS" TRANSFORMATION_TYPE="Expression" TYPE="TRANSFORMATION"/>
+    </MAPPING>
+</FOLDER>
+<FOLDER NAME="SHARED">
+    <TRANSFORMATION NAME="LKP_R" TYPE="Lookup Procedure" REUSABLE="YES">
+        <TABLEATTRIBUTE NAME="Lookup Source Database" VALUE="DIM_R"/>
+    </TRANSFORMATION>
+</FOLDER>
+</REPOSITORY>
+</POWERMART>
+"""
+
+
+def _parse_nodes(tmp_path):
+    workflow_file = tmp_path / "wf_m_sample.XML"
+    mapping_file = tmp_path / "m_sample.XML"
+    workflow_file.write_text(WORKFLOW_XML, encoding="utf-8")
+    mapping_file.write_text(MAPPING_XML, encoding="utf-8")
+    
+    parser = CanonicalInformaticaParser(enable_type_mapping=False)
+    nodes = [
+        node
+        for batch_nodes, _ in parser.parse(str(workflow_file), str(mapping_file))
+        for node in batch_nodes
+    ]
+    return {node.node_id: node for node in nodes}
+
+
+def test_reusable_transformation_defined_after_mapping_is_resolved(tmp_path):
+    nodes = _parse_nodes(tmp_path)
+    
+    assert nodes["mapping:m_one:lookup:LKP_R"].properties["lookup_source"] == "DIM_R"
+
+
+def test_mapping_local_transformations_resolve_per_mapping(tmp_path):
+    nodes = _parse_nodes(tmp_path)
+    
+    assert nodes["mapping:m_one:expression:EXPTRANS"].properties["expressions"] == {"OUT_A": "UPPER(A)"}
+    assert nodes["mapping:m_two:expression:EXPTRANS"].properties["expressions"] == {"OUT_B": "LOWER(B)"}
+
+
+SESSION_WORKFLOW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<POWERMART><REPOSITORY NAME="REPO"><FOLDER NAME="WF">
+    <WORKFLOW NAME="wf_one">
+        <SESSION NAME="s_m_one" MAPPINGNAME="m_one">
+            <SESSIONEXTENSION>
+                <CONNECTIONREFERENCE INSTANCENAME="LKP_R" CONNECTIONNAME="CONN_A"/>
+            </SESSIONEXTENSION>
+        </SESSION>
+    </WORKFLOW>
+</FOLDER></REPOSITORY></POWERMART>
+"""
+
+
+def test_session_connections_do_not_leak_between_workflow_files(tmp_path):
+    # The loader reuses one parser for every workflow file when parsing in-process
+    parser = CanonicalInformaticaParser(enable_type_mapping=False)
+    lookup_connections = []
+    for name, workflow_xml in (("a", SESSION_WORKFLOW_XML), ("b", WORKFLOW_XML)):
+        workflow_file = tmp_path / f"wf_{name}.XML"
+        mapping_file = tmp_path / f"m_{name}.XML"
+        workflow_file.write_text(workflow_xml, encoding="utf-8")
+        mapping_file.write_text(MAPPING_XML, encoding="utf-8")
+        
+        lookup_connections.extend(
+            node.properties["connection_name"]
+            for batch_nodes, _ in parser.parse(str(workflow_file), str(mapping_file))
+            for node in batch_nodes
+            if node.node_id == "mapping:m_one:lookup:LKP_R"
+        )
+    
+    assert lookup_connections == ["CONN_A", ""]
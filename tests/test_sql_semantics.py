@@ -0,0 +1,26 @@
+"""
+Tests for the EnhancedSqlParser semantics cache.
+"""
+
+from metazcode.sdk.ingestion.ssis import sql_semantics
+from metazcode.sdk.ingestion.ssis.sql_semantics import EnhancedSqlParser
+
+SQL = (
+    "SELECT o.id, c.name AS customer FROM dbo.Orders o "
+    "INNER JOIN dbo.Customers c ON o.customer_id = c.id WHERE o.total > 0"
+)
+
+
+def test_cache_hits_are_independent_copies():
+    sql_semantics._semantics_cache.clear()
+    parser = EnhancedSqlParser()
+    parsed = parser.parse_sql_semantics(SQL)
+    
+    hit = parser.parse_sql_semantics(SQL)
+    assert hit == parsed
+    assert hit.tables[0] is not parsed.tables[0]
+    
+    hit.tables[0].alias = "changed"
+    hit.columns.clear()
+    
+    assert parser.parse_sql_semantics(SQL) == parsed
@@ -0,0 +1,27 @@
+"""
+Tests for SsisLoader package parsing.
+"""
+
+from pathlib import Path
+
+from metazcode.sdk.ingestion.ssis.ssis_loader import SsisLoader
+
+PROJECT = Path(__file__).resolve().parent.parent / "data" / "ssis" / "ssis_mix"
+
+
+def _ingest(max_workers):
+    loader = SsisLoader(str(PROJECT))
+    loader.max_workers = max_workers
+    return list(loader.ingest())
+
+
+def test_small_project_is_parsed_in_process():
+    loader = SsisLoader(str(PROJECT))
+    assert loader.parse_worker_count(loader.discover_files("*.dtsx")) == 1
+
+
+def test_pool_output_matches_serial_output():
+    serial = _ingest(1)
+    pooled = _ingest(2)
+    assert len(serial) > 1
+    assert pooled == serial
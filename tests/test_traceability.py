@@ -0,0 +1,116 @@
+"""
+Tests for TraceabilityValidator.validate_graph_file and its result cache.
+"""
+
+import json
+import os
+
+import pytest
+
+from metazcode.sdk.models import traceability
+from metazcode.sdk.models.traceability import TraceabilityValidator
+
+NODE_PROPERTIES = {
+    "source_file_path": "/projects/demo/package.dtsx",
+    "source_file_type": "dtsx",
+    "technology": "SSIS",
+}
+EDGE_PROPERTIES = {
+    "source_file_path": "/projects/demo/package.dtsx",
+    "derivation_method": "xml_metadata",
+    "confidence_level": "high",
+    "technology": "SSIS",
+}
+
+
+@pytest.fixture
+def graph_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "graph.json"
+    path.write_text(
+        json.dumps({
+            "nodes": [
+                {"id": "a", "properties": NODE_PROPERTIES},
+                {"id": "b", "properties": {"technology": "SSIS"}},
+            ],
+            "links": [
+                {"source": "a", "target": "b", "properties": EDGE_PROPERTIES},
+                {"source": "b", "target": "a", "properties": {}},
+            ],
+        }),
+        encoding="utf-8",
+    )
+    return path
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("the cached result should have been used")
+
+
+def test_validate_graph_file_counts_traceable_elements(graph_file):
+    result = TraceabilityValidator.validate_graph_file(str(graph_file), use_cache=False)
+    
+    assert (result["total_nodes"], result["traceable_nodes"]) == (2, 1)
+    assert (result["total_edges"], result["traceable_edges"]) == (2, 1)
+    assert result["untraceable_nodes"] == ["b"]
+    assert result["untraceable_edges"] == ["b -> a"]
+    assert result["node_property_counts"]["technology"] == 2
+
+
+def test_cache_hit_skips_hashing_and_validation(graph_file, monkeypatch):
+    first = TraceabilityValidator.validate_graph_file(str(graph_file))
+    
+    monkeypatch.setattr(traceability, "_graph_file_digest", _fail)
+    monkeypatch.setattr(traceability, "_validate_graph_elements", _fail)
+    
+    assert TraceabilityValidator.validate_graph_file(str(graph_file)) == first
+
+
+def test_touched_file_with_same_contents_is_a_hit(graph_file, monkeypatch):
+    first = TraceabilityValidator.validate_graph_file(str(graph_file))
+    stat = graph_file.stat()
+    os.utime(graph_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    monkeypatch.setattr(traceability, "_validate_graph_elements", _fail)
+    
+    assert TraceabilityValidator.validate_graph_file(str(graph_file)) == first
+
+
+def test_rule_version_change_revalidates(graph_file, monkeypatch):
+    TraceabilityValidator.validate_graph_file(str(graph_file))
+    
+    calls = []
+    validate = traceability._validate_graph_elements
+    monkeypatch.setattr(
+        traceability,
+        "_validate_graph_elements",
+        lambda nodes, edges: calls.append(1) or validate(nodes, edges),
+    )
+    monkeypatch.setattr(traceability, "_VALIDATION_CACHE_KEY", "v0-test")
+    
+    TraceabilityValidator.validate_graph_file(str(graph_file))
+    
+    assert calls == [1]
+
+
+def test_corrupt_cache_file_is_revalidated(graph_file):
+    cache_file = traceability._validation_cache_file(str(graph_file))
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_bytes(b"\xff{not json")
+    
+    result = TraceabilityValidator.validate_graph_file(str(graph_file))
+    
+    assert result == TraceabilityValidator.validate_graph_file(str(graph_file), use_cache=False)
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["result"] == result
+
+
+def test_changed_contents_replace_the_cached_result(graph_file):
+    TraceabilityValidator.validate_graph_file(str(graph_file))
+    graph = json.loads(graph_file.read_text(encoding="utf-8"))
+    graph["nodes"][1]["properties"] = NODE_PROPERTIES
+    graph_file.write_text(json.dumps(graph), encoding="utf-8")
+    
+    result = TraceabilityValidator.validate_graph_file(str(graph_file))
+    
+    assert result["traceable_nodes"] == 2
+    assert len(list(traceability._validation_cache_file(str(graph_file)).parent.iterdir())) == 1